@@ -5,37 +5,261 @@ Multi-company e-commerce analysis tool with 7-layer anti-hallucination system.
 """
 
 import streamlit as st
-import json
-import pandas as pd
-from datetime import datetime
+import orjson
+import math
+import queue
 import sys
 import os
+import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 
-# Add project root to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# Add project root to path (once: Streamlit re-executes this module on every rerun)
+_app_dir = os.path.dirname(os.path.abspath(__file__))
+if _app_dir not in sys.path:
+    sys.path.insert(0, _app_dir)
 
-from core.analysis_engine import AnalysisEngine
+from utils.log_utils import setup_logging
+
+# Pipeline progress goes to the server log via a single queue-drained writer
+setup_logging()
+
+# Heavy modules (analysis engine, pandas, numpy) are imported where they are
+# first needed so the landing page renders without loading them.
 
 
 # ==============================================================================
 # HELPER FUNCTIONS
 # ==============================================================================
 
+# Signal expanders rendered per page in the Signals tab
+SIGNALS_PER_PAGE = 20
+
+# Signal fields (json_normalize dotted paths) -> CSV column headers
+SIGNAL_CSV_COLUMNS = {
+    'value.metric': 'Metric',
+    'value.numeric_value': 'Value',
+    'value.unit': 'Unit',
+    'value.period': 'Period',
+    'value.region': 'Region',
+    'confidence': 'Confidence',
+    'verbatim_quote': 'Quote',
+    'source_title': 'Source',
+    'source_url': 'URL'
+}
+
+
+# String dtype for table/filter columns (Arrow-backed when pyarrow is available)
+try:
+    import pyarrow  # noqa: F401  (streamlit dependency)
+    STRING_DTYPE = 'string[pyarrow]'
+except ImportError:
+    STRING_DTYPE = 'string'
+
+
+# Source fields -> Sources table column headers
+SOURCE_TABLE_COLUMNS = {
+    'title': 'Title',
+    'source': 'Type',
+    'url': 'URL',
+    'published_at': 'Date'
+}
+
+
+def _json_default(obj):
+    """
+    Fallback for types orjson can't serialize natively.
+    
+    Pydantic models are dumped; anything else is stringified rather than
+    expanded via __dict__ (which could walk arbitrary object graphs).
+    """
+    if hasattr(obj, 'model_dump'):  # Pydantic model
+        return obj.model_dump()
+    return str(obj)
+
+
 def make_json_safe(obj):
-    """Convert non-serializable objects to JSON-safe format."""
-    if isinstance(obj, datetime):
-        return obj.isoformat()
-    elif isinstance(obj, dict):
-        return {k: make_json_safe(v) for k, v in obj.items()}
-    elif isinstance(obj, (list, tuple)):
-        return [make_json_safe(item) for item in obj]
-    elif hasattr(obj, 'model_dump'):  # Pydantic model
-        return make_json_safe(obj.model_dump())
-    elif hasattr(obj, '__dict__'):  # Other objects
-        return make_json_safe(obj.__dict__)
-    else:
-        return obj
+    """
+    Convert non-serializable objects to JSON-safe format.
+    
+    Single C-level round-trip through orjson (handles datetime natively)
+    instead of a recursive Python walk.
+    """
+    return orjson.loads(
+        orjson.dumps(obj, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    )
+
+
+def _signals_to_csv_bytes(signals: list) -> bytes:
+    """
+    Signals as RFC-4180 CSV bytes (pandas handles quoting of commas,
+    quotes and newlines in quotes/titles).
+    """
+    import pandas as pd
+    
+    df = (
+        pd.json_normalize(signals)
+        .reindex(columns=list(SIGNAL_CSV_COLUMNS))
+        .rename(columns=SIGNAL_CSV_COLUMNS)
+    )
+    return df.to_csv(index=False).encode('utf-8')
+
+
+def _result_key(result: dict) -> str:
+    """Stable identity of an analysis result (company + run start time)."""
+    stats = result.get('stats') or {}
+    return f"{result.get('company', '')}|{stats.get('start_time', '')}"
+
+
+@st.cache_data(show_spinner=False)
+def _signals_frame(result_key: str, _signals: list):
+    """
+    Flat metric/region view of the signals for vectorized filtering.
+    
+    Built once per result (only result_key is hashed). Row i matches
+    signals[i]; missing values map to 'unknown' / 'Unknown'.
+    """
+    import pandas as pd
+    
+    df = (
+        pd.json_normalize(_signals)
+        .reindex(columns=['value.metric', 'value.region'])
+        .rename(columns={'value.metric': 'metric', 'value.region': 'region'})
+    )
+    for col, default in (('metric', 'unknown'), ('region', 'Unknown')):
+        df[col] = (
+            df[col].astype(STRING_DTYPE)
+            .mask(lambda c: c.isna() | (c == ''), default)
+        )
+    return df
+
+
+@st.cache_data(show_spinner=False)
+def _filter_options(result_key: str, _signals: list) -> tuple:
+    """Sorted unique metric and region filter options, computed once per result."""
+    df = _signals_frame(result_key, _signals)
+    return sorted(df['metric'].unique().tolist()), sorted(df['region'].unique().tolist())
+
+
+@st.cache_data(show_spinner=False)
+def _summary_frames(result_key: str, _report: dict) -> tuple:
+    """
+    Report tab tables (summary, signals-by-metric counts), built once per result.
+    
+    Returns:
+        (summary_df, metric_df); metric_df is None when there are no metrics
+    """
+    import pandas as pd
+    
+    summary = _report.get('summary') or {}
+    summary_df = pd.DataFrame([
+        {"Metric": k.replace('_', ' ').title(), "Value": v}
+        for k, v in summary.items()
+        if not isinstance(v, dict)
+    ])
+    
+    signals_by_metric = _report.get('signals_by_metric') or {}
+    metric_df = None
+    if signals_by_metric:
+        metric_df = pd.DataFrame(
+            sorted(
+                ((metric, len(sigs)) for metric, sigs in signals_by_metric.items()),
+                key=lambda x: -x[1]
+            ),
+            columns=["Metric", "Count"]
+        )
+    
+    return summary_df, metric_df
+
+
+@st.cache_resource
+def _get_executor() -> ThreadPoolExecutor:
+    """Process-wide worker pool for analysis runs (survives reruns)."""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="analysis")
+
+
+@st.cache_resource
+def get_scraper_resources():
+    """
+    Process-wide HTTP sessions, search client and disk caches (survive reruns),
+    with the on-disk HTTP cache for index/feed pages turned on. Each run builds
+    its own scraper on top, so concurrent runs on the executor never share
+    per-run stats or memos.
+    """
+    from core.scraper import ScraperResources
+    return ScraperResources({"http_cache": True})
+
+
+class _AnalysisNotCached(Exception):
+    """Carries a non-success result out of the cached helper (raising skips st.cache_data)."""
+    
+    def __init__(self, result: dict):
+        super().__init__(result.get('status'))
+        self.result = result
+
+
+@st.cache_data(ttl=3600, max_entries=128, show_spinner=False)
+def _run_analysis_cached(
+    company: str,
+    lookback_days: int,
+    max_sources: int,
+    _progress_callback=None
+) -> dict:
+    """
+    Run the full analysis pipeline, cached per (company, lookback, max_sources).
+    
+    Reruns triggered by widgets (filters, tabs, sidebar toggles) hit the cache
+    instead of re-scraping and re-calling the LLM. The progress callback is
+    excluded from the cache key (leading underscore).
+    
+    Returns:
+        JSON-safe result dict (safe to pickle and serialize)
+    
+    Raises:
+        _AnalysisNotCached: If the run did not succeed (errors, no sources or
+            no signals), so the outcome isn't replayed from the cache
+    """
+    from core.analysis_engine import AnalysisEngine
+    from core.scraper import CompanyIntelligenceScraper
+    
+    config = {
+        'lookback_days': lookback_days,
+        'max_sources': max_sources
+    }
+    engine = AnalysisEngine(
+        company_name=company,
+        config=config,
+        progress_callback=_progress_callback,
+        scraper=CompanyIntelligenceScraper(company, config, resources=get_scraper_resources())
+    )
+    result = make_json_safe(engine.run_analysis())
+    if result['status'] != 'success':
+        raise _AnalysisNotCached(result)
+    return result
+
+
+def _run_analysis(
+    company: str,
+    lookback_days: int,
+    max_sources: int,
+    _progress_callback=None
+) -> dict:
+    """
+    Run the analysis; only successful results are cached, so a failed or
+    empty run can be retried right away.
+    
+    Returns:
+        JSON-safe result dict
+    """
+    try:
+        return _run_analysis_cached(
+            company,
+            lookback_days,
+            max_sources,
+            _progress_callback=_progress_callback
+        )
+    except _AnalysisNotCached as e:
+        return e.result
 
 
 # ==============================================================================
@@ -129,35 +353,51 @@ with col2:
 # RUN ANALYSIS
 # ==============================================================================
 
-if analyze_button and company_name:
-    # Build config
-    config = {
-        'lookback_days': lookback_days,
-        'max_sources': max_sources
+if analyze_button and company_name and 'analysis_job' not in st.session_state:
+    # Run analysis in a worker thread (cached per company + config). The worker
+    # never touches Streamlit APIs: progress goes through a queue that the
+    # script drains on each rerun.
+    progress_queue = queue.Queue()
+    
+    def update_progress(message: str, percent: float):
+        """Progress callback (called from the worker thread)."""
+        progress_queue.put((message, percent))
+    
+    st.session_state['analysis_job'] = {
+        'future': _get_executor().submit(
+            _run_analysis,
+            company_name,
+            lookback_days,
+            max_sources,
+            _progress_callback=update_progress
+        ),
+        'queue': progress_queue,
+        'company': company_name,
+        'progress': ("🔍 Starting analysis...", 0.0)
     }
+
+if 'analysis_job' in st.session_state:
+    job = st.session_state['analysis_job']
     
-    # Progress tracking
-    progress_bar = st.progress(0)
-    status_text = st.empty()
+    # Drain progress updates posted by the worker
+    while True:
+        try:
+            job['progress'] = job['queue'].get_nowait()
+        except queue.Empty:
+            break
     
-    def update_progress(message: str, percent: float):
-        """Progress callback."""
-        progress_bar.progress(percent)
-        status_text.info(f"**{message}**")
+    if not job['future'].done():
+        message, percent = job['progress']
+        with st.status(f"Analyzing {job['company']}...", expanded=True):
+            st.progress(min(max(percent, 0.0), 1.0))
+            st.info(f"**{message}**")
+        time.sleep(0.2)
+        st.rerun()
+    
+    del st.session_state['analysis_job']
     
     try:
-        # Run analysis
-        engine = AnalysisEngine(
-            company_name=company_name,
-            config=config,
-            progress_callback=update_progress
-        )
-        
-        result = engine.run_analysis()
-        
-        # Clear progress
-        progress_bar.empty()
-        status_text.empty()
+        result = job['future'].result()
         
         # Check status
         if result['status'] != 'success':
@@ -170,10 +410,17 @@ if analyze_button and company_name:
                 - Check company name spelling
                 """)
         
-        # Store result in session
+        # Store result in session, with export payloads serialized once
+        # here instead of on every rerun of the Export tab
         st.session_state['last_result'] = result
-        st.session_state['last_company'] = company_name
-        
+        st.session_state['last_company'] = job['company']
+        st.session_state['last_result_json'] = orjson.dumps(
+            result,
+            default=_json_default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+        st.session_state['last_result_csv'] = _signals_to_csv_bytes(result.get('signals', []))
+    
     except Exception as e:
         st.error(f"❌ Analysis failed: {str(e)}")
         if show_debug:
@@ -181,6 +428,170 @@ if analyze_button and company_name:
         st.stop()
 
 
+# ==============================================================================
+# RESULT TABS
+# ==============================================================================
+
+@st.fragment
+def render_signals_tab(result: dict, show_debug: bool):
+    """Signals tab (fragment: filter/page changes rerun only this block)."""
+    import numpy as np
+    
+    signals = result.get('signals', [])
+    
+    if not signals:
+        st.info("No high-confidence signals found.")
+    else:
+        st.subheader(f"Found {len(signals)} High-Confidence Signals")
+        
+        # Filters
+        result_key = _result_key(result)
+        metrics, regions = _filter_options(result_key, signals)
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            selected_metric = st.selectbox(
+                "Filter by Metric",
+                options=['All'] + metrics
+            )
+        
+        with col2:
+            selected_region = st.selectbox(
+                "Filter by Region",
+                options=['All'] + regions
+            )
+        
+        # Apply filters (boolean masks over the cached frame)
+        filtered_signals = signals
+        if selected_metric != 'All' or selected_region != 'All':
+            signals_df = _signals_frame(result_key, signals)
+            mask = np.ones(len(signals_df), dtype=bool)
+            if selected_metric != 'All':
+                mask &= signals_df['metric'].to_numpy() == selected_metric
+            if selected_region != 'All':
+                mask &= signals_df['region'].to_numpy() == selected_region
+            filtered_signals = [signals[i] for i in np.flatnonzero(mask)]
+        
+        # Pagination (only the current page's expanders are built)
+        n_pages = max(1, math.ceil(len(filtered_signals) / SIGNALS_PER_PAGE))
+        page = 1
+        if n_pages > 1:
+            page = st.number_input(
+                f"Page (of {n_pages})",
+                min_value=1,
+                max_value=n_pages,
+                value=1,
+                step=1
+            )
+        start = (page - 1) * SIGNALS_PER_PAGE
+        page_signals = filtered_signals[start:start + SIGNALS_PER_PAGE]
+        
+        # Display signals
+        for i, signal in enumerate(page_signals, start + 1):
+            # Bind lookups once per row
+            sget = signal.get
+            vget = sget('value', {}).get
+            numeric_value = vget('numeric_value', 'N/A')
+            unit = vget('unit', '')
+            conf_pct = sget('confidence', 0) * 100
+            
+            with st.expander(
+                f"**{i}. {vget('metric', 'Unknown')}** - "
+                f"{numeric_value} {unit} "
+                f"[{conf_pct:.0f}% confidence]"
+            ):
+                # Main info
+                col1, col2 = st.columns([2, 1])
+                
+                with col1:
+                    st.markdown(f"**Metric:** {vget('metric', 'N/A')}")
+                    st.markdown(f"**Value:** {numeric_value} {unit}")
+                    st.markdown(f"**Period:** {vget('period', 'N/A')}")
+                    st.markdown(f"**Region:** {vget('region', 'N/A')}")
+                    
+                    context = vget('context')
+                    if context:
+                        st.markdown(f"**Context:** {context}")
+                
+                with col2:
+                    st.metric("Confidence", f"{conf_pct:.1f}%")
+                    
+                    # Validation badges
+                    if sget('citation_valid'):
+                        st.success("✓ Citation verified")
+                    
+                    corr_count = sget('corroboration_count', 0)
+                    if corr_count > 0:
+                        st.info(f"🔗 {corr_count} corroborating sources")
+                    
+                    llm_ver = sget('llm_verification', {})
+                    if llm_ver.get('verified'):
+                        st.success("✓ LLM verified")
+                
+                # Quote
+                st.markdown("**Verbatim Quote:**")
+                st.markdown(f"> {sget('verbatim_quote', 'N/A')}")
+                
+                # Source
+                st.markdown(f"**Source:** [{sget('source_title', 'Unknown')}]({sget('source_url', '#')})")
+        
+        # Debug info (one JSON view for the selected signal instead of one per row)
+        if show_debug and filtered_signals:
+            selected_idx = st.selectbox(
+                "Signal Details",
+                options=range(len(filtered_signals)),
+                format_func=lambda j: (
+                    f"{j + 1}. {filtered_signals[j].get('value', {}).get('metric', 'Unknown')}"
+                )
+            )
+            st.json(filtered_signals[selected_idx])
+
+
+@st.fragment
+def render_sources_tab(result: dict, show_debug: bool):
+    """Sources tab (fragment: reruns independently of the rest of the page)."""
+    import pandas as pd
+    
+    sources = result.get('sources', [])
+    
+    if not sources:
+        st.info("No sources found.")
+    else:
+        st.subheader(f"Analyzed {len(sources)} Sources")
+        
+        # Create DataFrame (only the table columns are ingested; raw_text etc. is skipped)
+        df = pd.DataFrame.from_records(
+            sources,
+            columns=list(SOURCE_TABLE_COLUMNS),
+            coerce_float=False
+        ).rename(columns=SOURCE_TABLE_COLUMNS)
+        df['Title'] = df['Title'].fillna('N/A').astype(STRING_DTYPE).str.slice(0, 60)
+        df['Type'] = df['Type'].fillna('unknown').astype('category')
+        df['URL'] = df['URL'].fillna('N/A').astype(STRING_DTYPE)
+        df['Date'] = pd.to_datetime(df['Date'], errors='coerce', utc=True, format='ISO8601')
+        
+        # Display table (typed columns serialize to Arrow without inference)
+        st.dataframe(
+            df,
+            column_config={
+                'URL': st.column_config.LinkColumn('URL'),
+                'Date': st.column_config.DateColumn('Date')
+            },
+            use_container_width=True,
+            hide_index=True
+        )
+        
+        # Source details
+        if show_debug:
+            st.markdown("### Source Details")
+            selected_idx = st.selectbox(
+                "Select source",
+                options=range(len(sources)),
+                format_func=lambda j: f"{j + 1}. {(sources[j].get('title') or 'Unknown')[:80]}"
+            )
+            st.json(sources[selected_idx])
+
+
 # ==============================================================================
 # DISPLAY RESULTS
 # ==============================================================================
@@ -234,133 +645,11 @@ if 'last_result' in st.session_state:
     
     # TAB 1: SIGNALS
     with tab1:
-        signals = result.get('signals', [])
-        
-        if not signals:
-            st.info("No high-confidence signals found.")
-        else:
-            st.subheader(f"Found {len(signals)} High-Confidence Signals")
-            
-            # Filters
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                # Get unique metrics
-                metrics = list(set(
-                    s.get('value', {}).get('metric', 'unknown')
-                    for s in signals
-                ))
-                selected_metric = st.selectbox(
-                    "Filter by Metric",
-                    options=['All'] + sorted(metrics)
-                )
-            
-            with col2:
-                # Get unique regions
-                regions = list(set(
-                    s.get('value', {}).get('region', 'Unknown')
-                    for s in signals
-                ))
-                selected_region = st.selectbox(
-                    "Filter by Region",
-                    options=['All'] + sorted(regions)
-                )
-            
-            # Apply filters
-            filtered_signals = signals
-            if selected_metric != 'All':
-                filtered_signals = [
-                    s for s in filtered_signals
-                    if s.get('value', {}).get('metric') == selected_metric
-                ]
-            if selected_region != 'All':
-                filtered_signals = [
-                    s for s in filtered_signals
-                    if s.get('value', {}).get('region') == selected_region
-                ]
-            
-            # Display signals
-            for i, signal in enumerate(filtered_signals, 1):
-                value = signal.get('value', {})
-                
-                with st.expander(
-                    f"**{i}. {value.get('metric', 'Unknown')}** - "
-                    f"{value.get('numeric_value', 'N/A')} {value.get('unit', '')} "
-                    f"[{signal.get('confidence', 0)*100:.0f}% confidence]"
-                ):
-                    # Main info
-                    col1, col2 = st.columns([2, 1])
-                    
-                    with col1:
-                        st.markdown(f"**Metric:** {value.get('metric', 'N/A')}")
-                        st.markdown(f"**Value:** {value.get('numeric_value', 'N/A')} {value.get('unit', '')}")
-                        st.markdown(f"**Period:** {value.get('period', 'N/A')}")
-                        st.markdown(f"**Region:** {value.get('region', 'N/A')}")
-                        
-                        if value.get('context'):
-                            st.markdown(f"**Context:** {value['context']}")
-                    
-                    with col2:
-                        conf = signal.get('confidence', 0)
-                        st.metric("Confidence", f"{conf*100:.1f}%")
-                        
-                        # Validation badges
-                        if signal.get('citation_valid'):
-                            st.success("✓ Citation verified")
-                        
-                        corr_count = signal.get('corroboration_count', 0)
-                        if corr_count > 0:
-                            st.info(f"🔗 {corr_count} corroborating sources")
-                        
-                        llm_ver = signal.get('llm_verification', {})
-                        if llm_ver.get('verified'):
-                            st.success("✓ LLM verified")
-                    
-                    # Quote
-                    st.markdown("**Verbatim Quote:**")
-                    st.markdown(f"> {signal.get('verbatim_quote', 'N/A')}")
-                    
-                    # Source
-                    st.markdown(f"**Source:** [{signal.get('source_title', 'Unknown')}]({signal.get('source_url', '#')})")
-                    
-                    # Debug info
-                    if show_debug:
-                        st.json(signal)
+        render_signals_tab(result, show_debug)
     
     # TAB 2: SOURCES
     with tab2:
-        sources = result.get('sources', [])
-        
-        if not sources:
-            st.info("No sources found.")
-        else:
-            st.subheader(f"Analyzed {len(sources)} Sources")
-            
-            # Create DataFrame
-            source_data = []
-            for src in sources:
-                source_data.append({
-                    'Title': src.get('title', 'N/A')[:60],
-                    'Type': src.get('type', 'unknown'),
-                    'URL': src.get('url', 'N/A'),
-                    'Date': src.get('published_date', 'N/A')
-                })
-            
-            df = pd.DataFrame(source_data)
-            
-            # Display table
-            st.dataframe(
-                df,
-                use_container_width=True,
-                hide_index=True
-            )
-            
-            # Source details
-            if show_debug:
-                st.markdown("### Source Details")
-                for i, src in enumerate(sources[:5], 1):  # Show first 5
-                    with st.expander(f"{i}. {src.get('title', 'Unknown')[:80]}"):
-                        st.json(src)
+        render_sources_tab(result, show_debug)
     
     # TAB 3: REPORT
     with tab3:
@@ -368,30 +657,15 @@ if 'last_result' in st.session_state:
             st.info("Report not available.")
         else:
             st.subheader("Analysis Report")
+            summary_df, metric_df = _summary_frames(_result_key(result), report)
             
             # Summary
             st.markdown("### Summary")
-            summary_df = pd.DataFrame([
-                {"Metric": k.replace('_', ' ').title(), "Value": v}
-                for k, v in summary.items()
-                if not isinstance(v, dict)
-            ])
             st.dataframe(summary_df, use_container_width=True, hide_index=True)
             
             # Signals by metric
-            if report.get('signals_by_metric'):
+            if metric_df is not None:
                 st.markdown("### Signals by Metric Type")
-                
-                metric_counts = {
-                    metric: len(sigs)
-                    for metric, sigs in report['signals_by_metric'].items()
-                }
-                
-                metric_df = pd.DataFrame([
-                    {"Metric": m, "Count": c}
-                    for m, c in sorted(metric_counts.items(), key=lambda x: -x[1])
-                ])
-                
                 st.dataframe(metric_df, use_container_width=True, hide_index=True)
             
             # Validation stats
@@ -406,44 +680,26 @@ if 'last_result' in st.session_state:
         col1, col2 = st.columns(2)
         
         with col1:
-            # JSON export (make sure it's JSON-safe)
-            safe_result = make_json_safe(result)
-            json_str = json.dumps(safe_result, indent=2, ensure_ascii=False)
+            # JSON export (serialized once when the result was stored)
+            json_bytes = st.session_state['last_result_json']
             st.download_button(
                 label="📥 Download as JSON",
-                data=json_str,
+                data=json_bytes,
                 file_name=f"{company.lower().replace(' ', '_')}_analysis.json",
-                mime="application/json"
+                mime="application/json",
+                on_click="ignore"
             )
         
         with col2:
             # CSV export (signals only)
             signals = result.get('signals', [])
             if signals:
-                # Flatten signals for CSV
-                csv_data = []
-                for sig in signals:
-                    val = sig.get('value', {})
-                    csv_data.append({
-                        'Metric': val.get('metric', ''),
-                        'Value': val.get('numeric_value', ''),
-                        'Unit': val.get('unit', ''),
-                        'Period': val.get('period', ''),
-                        'Region': val.get('region', ''),
-                        'Confidence': sig.get('confidence', 0),
-                        'Quote': sig.get('verbatim_quote', ''),
-                        'Source': sig.get('source_title', ''),
-                        'URL': sig.get('source_url', '')
-                    })
-                
-                df = pd.DataFrame(csv_data)
-                csv_str = df.to_csv(index=False)
-                
                 st.download_button(
                     label="📥 Download Signals as CSV",
-                    data=csv_str,
+                    data=st.session_state['last_result_csv'],
                     file_name=f"{company.lower().replace(' ', '_')}_signals.csv",
-                    mime="text/csv"
+                    mime="text/csv",
+                    on_click="ignore"
                 )
             else:
                 st.info("No signals to export.")
@@ -451,7 +707,17 @@ if 'last_result' in st.session_state:
         # Show preview
         if show_debug:
             st.markdown("### Export Preview (JSON)")
-            st.code(json_str[:1000] + "\n...", language="json")
+            preview = orjson.dumps(
+                {
+                    'status': result.get('status'),
+                    'company': result.get('company'),
+                    'signals': result.get('signals', [])[:2],
+                    'sources': result.get('sources', [])[:2]
+                },
+                default=_json_default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+            st.code(preview[:1000].decode('utf-8', errors='ignore') + "\n...", language="json")
 
 
 # ==============================================================================
@@ -13,6 +13,8 @@ This is the main entry point for running a company analysis.
 
 import sys
 import os
+import math
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Callable
 from datetime import datetime
 
@@ -30,6 +32,10 @@ from validators.cross_reference import CrossReferenceValidator
 from validators.llm_fact_checker import LLMFactChecker
 
 
+# Number of signal shards for the validation pipeline (steps 3-5)
+VALIDATION_SHARDS = 8
+
+
 class AnalysisEngine:
     """
     Orchestrates complete company analysis pipeline.
@@ -48,7 +54,8 @@ class AnalysisEngine:
         self,
         company_name: str,
         config: Optional[dict] = None,
-        progress_callback: Optional[Callable] = None
+        progress_callback: Optional[Callable] = None,
+        scraper: Optional[CompanyIntelligenceScraper] = None
     ):
         """
         Initialize analysis engine.
@@ -57,13 +64,14 @@ class AnalysisEngine:
             company_name: Company to analyze
             config: Configuration dict (scraper settings, etc.)
             progress_callback: Optional callback(message: str, progress: float)
+            scraper: Optional pre-built scraper to reuse (its stats are reset per run)
         """
         self.company_name = company_name
         self.config = config or {}
         self.progress_callback = progress_callback or (lambda msg, pct: None)
         
         # Initialize components (validators will be created after we have sources)
-        self.scraper = CompanyIntelligenceScraper(company_name, config)
+        self.scraper = scraper or CompanyIntelligenceScraper(company_name, config)
         self.extractor = SignalExtractor()
         
         # Results
@@ -73,6 +81,10 @@ class AnalysisEngine:
         self.final_signals = []
         self.report = {}
         
+        # Component stats, captured once after their pipeline step
+        self._scraper_stats = None
+        self._extractor_stats = None
+        
         # Stats
         self.stats = {
             'start_time': None,
@@ -92,11 +104,15 @@ class AnalysisEngine:
             Analysis result dict with sources, signals, and report
         """
         self.stats['start_time'] = datetime.now()
+        self._scraper_stats = None
+        self._extractor_stats = None
         
         try:
             # Step 1: Discover sources (0-30%)
             self._progress("🔍 Discovering sources...", 0.0)
+            self.scraper.reset_stats()
             self.sources = self.scraper.discover_all_sources()
+            self._scraper_stats = self.scraper.get_stats()
             self._progress(f"✓ Found {len(self.sources)} sources", 0.30)
             
             if not self.sources:
@@ -109,6 +125,7 @@ class AnalysisEngine:
                 self.sources,
                 self.company_name
             )
+            self._extractor_stats = self.extractor.get_stats()
             self._progress(f"✓ Extracted {len(self.raw_signals)} raw signals", 0.50)
             
             if not self.raw_signals:
@@ -121,50 +138,24 @@ class AnalysisEngine:
                 self.report = self._generate_report(filter_results)
                 return self._build_result("No signals extracted from sources")
             
-            # Step 3: Citation validation (50-60%)
+            # Steps 3-5: Citation -> cross-reference -> LLM fact-check (50-85%)
             self._progress("📝 Validating citations...", 0.50)
             self.citation_validator = CitationValidator(self.sources)
-            citation_results = self.citation_validator.validate_all_signals(
-                self.raw_signals,
-                self.sources
-            )
-            self.validated_signals = citation_results['validated_signals']
-            self._progress(
-                f"✓ Validated {len(self.validated_signals)} signals",
-                0.60
-            )
+            self.cross_validator = CrossReferenceValidator()
+            self.fact_checker = LLMFactChecker()
+            self.validated_signals = self._run_validation_pipeline(self.raw_signals)
             
             if not self.validated_signals:
                 # Still generate report even with 0 signals
-                self.cross_validator = CrossReferenceValidator()
-                self.fact_checker = LLMFactChecker()
                 self.confidence_filter = ConfidenceFilter()
                 filter_results = {'high_confidence': [], 'medium_confidence': [], 'low_confidence': [], 'stats': {}}
                 self.report = self._generate_report(filter_results)
                 return self._build_result("All signals failed citation validation")
             
-            # Step 4: Cross-reference validation (60-70%)
-            self._progress("🔗 Cross-referencing sources...", 0.60)
-            self.cross_validator = CrossReferenceValidator()
-            self.validated_signals = self.cross_validator.validate_signals_cross_reference(
-                self.validated_signals,
-                self.sources
-            )
-            self._progress("✓ Cross-reference complete", 0.70)
-            
-            # Step 5: LLM fact-checking (70-85%)
-            self._progress("🔍 LLM fact-checking...", 0.70)
-            self.fact_checker = LLMFactChecker()
-            self.validated_signals = self.fact_checker.verify_signals(
-                self.validated_signals,
-                self.sources
-            )
-            self._progress("✓ Fact-checking complete", 0.85)
-            
             # Step 6: Confidence filtering (85-90%)
             self._progress("📊 Filtering by confidence...", 0.85)
             self.confidence_filter = ConfidenceFilter()
-            filter_results = self.confidence_filter.filter_signals(self.validated_signals)
+            filter_results = self._filter_by_confidence(self.validated_signals)
             self.final_signals = filter_results['high_confidence']
             self._progress(
                 f"✓ {len(self.final_signals)} high-confidence signals",
@@ -188,8 +179,83 @@ class AnalysisEngine:
                 delta = self.stats['end_time'] - self.stats['start_time']
                 self.stats['duration_seconds'] = delta.total_seconds()
     
+    def _run_validation_pipeline(self, signals: list) -> list:
+        """
+        Run citation, cross-reference and LLM fact-check validation (steps 3-5).
+        
+        Signals are split into shards. Citation and cross-reference checks
+        (cheap, local) run for shard N while the LLM fact-check (network-bound)
+        of shard N-1 runs in a background thread. Each validator is only used
+        from one thread; results keep the original signal order.
+        
+        Args:
+            signals: Raw extracted signals
+        
+        Returns:
+            Signals that passed citation validation, cross-referenced and fact-checked
+        """
+        shard_size = max(1, math.ceil(len(signals) / VALIDATION_SHARDS))
+        shards = [signals[i:i + shard_size] for i in range(0, len(signals), shard_size)]
+        
+        # Normalize source texts once for all shards
+        source_index = self.cross_validator.build_source_index(self.sources)
+        
+        pending = []
+        with ThreadPoolExecutor(max_workers=1) as fact_check_pool:
+            for n, shard in enumerate(shards, 1):
+                valid = self.citation_validator.validate_all_signals(shard)
+                valid = self.cross_validator.validate_signals_cross_reference(
+                    valid,
+                    self.sources,
+                    source_index
+                )
+                if valid:
+                    pending.append(
+                        fact_check_pool.submit(self.fact_checker.verify_signals, valid, self.sources)
+                    )
+                self._progress(
+                    f"🔗 Validated shard {n}/{len(shards)}, fact-checking...",
+                    0.50 + 0.20 * n / len(shards)
+                )
+            
+            validated = []
+            for n, future in enumerate(pending, 1):
+                validated.extend(future.result())
+                self._progress(
+                    f"🔍 Fact-checked {n}/{len(pending)} batches",
+                    0.70 + 0.15 * n / len(pending)
+                )
+        
+        self._progress(f"✓ Validated {len(validated)} signals", 0.85)
+        return validated
+    
+    def _filter_by_confidence(self, signals: list) -> dict:
+        """
+        Group signals by ConfidenceFilter tier.
+        
+        Returns:
+            Dict with high_confidence (verified + high), medium_confidence,
+            low_confidence and the filter stats
+        """
+        tiers = self.confidence_filter.filter_signals(signals)
+        return {
+            'high_confidence': tiers['verified'] + tiers['high'],
+            'medium_confidence': tiers['medium'],
+            'low_confidence': tiers['low'],
+            'stats': self.confidence_filter.get_stats()
+        }
+    
+    def _component_stats(self) -> tuple:
+        """Scraper and extractor stats (memoized; read live only if a step didn't record them)."""
+        if self._scraper_stats is None:
+            self._scraper_stats = self.scraper.get_stats()
+        if self._extractor_stats is None:
+            self._extractor_stats = self.extractor.get_stats()
+        return self._scraper_stats, self._extractor_stats
+    
     def _generate_empty_report(self, reason: str) -> dict:
         """Generate minimal report when analysis fails early."""
+        scraper_stats, extractor_stats = self._component_stats()
         return {
             'company': self.company_name,
             'generated_at': datetime.now().isoformat(),
@@ -204,8 +270,8 @@ class AnalysisEngine:
             'signals_by_metric': {},
             'all_high_confidence_signals': [],
             'validation_stats': {
-                'scraper': self.scraper.get_stats() if hasattr(self, 'scraper') else {},
-                'extractor': self.extractor.get_stats() if hasattr(self, 'extractor') else {},
+                'scraper': scraper_stats,
+                'extractor': extractor_stats,
                 'error': reason
             }
         }
@@ -222,26 +288,22 @@ class AnalysisEngine:
         """
         high_conf = filter_results['high_confidence']
         medium_conf = filter_results['medium_confidence']
+        scraper_stats, extractor_stats = self._component_stats()
         
-        # Group signals by metric type
+        # Group signals by metric type and count regions (single pass)
         metrics_map = {}
+        regions = {}
         for sig in high_conf:
-            metric = sig.get('value', {}).get('metric', 'unknown')
-            if metric not in metrics_map:
-                metrics_map[metric] = []
-            metrics_map[metric].append(sig)
+            vget = sig.get('value', {}).get
+            metrics_map.setdefault(vget('metric', 'unknown'), []).append(sig)
+            region = vget('region', 'Unknown')
+            regions[region] = regions.get(region, 0) + 1
         
         # Summary stats
         total_sources = len(self.sources)
         high_conf_count = len(high_conf)
         medium_conf_count = len(medium_conf)
         
-        # Regional breakdown
-        regions = {}
-        for sig in high_conf:
-            region = sig.get('value', {}).get('region', 'Unknown')
-            regions[region] = regions.get(region, 0) + 1
-        
         return {
             'company': self.company_name,
             'generated_at': datetime.now().isoformat(),
@@ -255,8 +317,8 @@ class AnalysisEngine:
             'signals_by_metric': metrics_map,
             'all_high_confidence_signals': high_conf,
             'validation_stats': {
-                'scraper': self.scraper.get_stats(),
-                'extractor': self.extractor.get_stats(),
+                'scraper': scraper_stats,
+                'extractor': extractor_stats,
                 'citation_validator': self.citation_validator.get_stats() if hasattr(self, 'citation_validator') else {},
                 'cross_reference': self.cross_validator.get_stats() if hasattr(self, 'cross_validator') else {},
                 'fact_checker': self.fact_checker.get_stats() if hasattr(self, 'fact_checker') else {},
@@ -310,6 +372,9 @@ def analyze_company(
 
 if __name__ == "__main__":
     import sys
+    from utils.log_utils import setup_logging
+    
+    setup_logging()
     
     company = sys.argv[1] if len(sys.argv) > 1 else "ACME Corp"
     
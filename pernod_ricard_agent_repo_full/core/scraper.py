@@ -9,23 +9,51 @@ Discovers sources from:
 
 import os
 import re
+import logging
 import math
 import time
+import codecs
+import hashlib
+import threading
+from email.utils import parsedate_to_datetime
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, Dict
 from datetime import datetime, timezone, timedelta
-from urllib.parse import urlencode, urljoin
+from urllib.parse import urlencode, urljoin, urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import feedparser
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
 from dateutil import parser as dateparser
 
+# optional: HTTP response cache with ETag/Last-Modified revalidation
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+# optional: main-content extraction (falls back to full-page text)
+try:
+    from readability.readability import Document
+except ImportError:
+    Document = None
+
+# optional: single-pass multi-keyword matching
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 # Import our utilities
 import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils.url_utils import (
     guess_domain_from_company_name,
-    normalize_url,
+    canonicalize_url,
+    url_fingerprint,
     is_eu_url,
     build_newsroom_candidates,
     build_investor_relations_candidates,
@@ -41,9 +69,14 @@ from utils.pdf_utils import (
     extract_text_from_pdf_url,
     is_pdf_url,
     is_earnings_report_pdf,
-    extract_key_metrics_from_text
+    extract_key_metrics_from_text,
+    EARNINGS_KEYWORDS,
+    EARNINGS_MIN_MATCHES
 )
 from utils.search_api import GoogleSearchClient
+from utils.disk_cache import DiskCache, user_cache_dir, ensure_private_dir
+
+logger = logging.getLogger(__name__)
 
 
 # ==============================================================================
@@ -68,16 +101,20 @@ EU_GNEWS_EDITIONS = [
     ("en-GB", "GB", "GB:en-GB"), # UK
 ]
 
-# E-Commerce query templates (multi-language)
-ECOMMERCE_QUERY_TEMPLATES = [
-    # German
-    '{company} (E-Commerce OR "E-Commerce" OR Onlinehandel OR Marktplatz OR "Retail Media" OR Amazon OR Zalando OR D2C)',
-    # English
-    '{company} (ecommerce OR "e-commerce" OR marketplace OR "retail media" OR Amazon OR D2C OR "online sales")',
-    # French
-    '{company} (e-commerce OR "commerce en ligne" OR marketplace OR "retail media" OR Amazon OR D2C)',
-    # Spanish
-    '{company} (ecommerce OR "comercio electrónico" OR marketplace OR "retail media" OR Amazon OR D2C)',
+# E-Commerce query templates, keyed by edition language (without region suffix)
+ECOMMERCE_QUERY_TEMPLATES = {
+    "de": '{company} (E-Commerce OR "E-Commerce" OR Onlinehandel OR Marktplatz OR "Retail Media" OR Amazon OR Zalando OR D2C)',
+    "en": '{company} (ecommerce OR "e-commerce" OR marketplace OR "retail media" OR Amazon OR D2C OR "online sales")',
+    "fr": '{company} (e-commerce OR "commerce en ligne" OR marketplace OR "retail media" OR Amazon OR D2C)',
+    "es": '{company} (ecommerce OR "comercio electrónico" OR marketplace OR "retail media" OR Amazon OR D2C)',
+}
+
+# Key EU markets for the e-commerce queries (one query per market, in its language)
+ECOMMERCE_KEY_MARKETS = [
+    ("de", "DE", "DE:de"),
+    ("en-GB", "GB", "GB:en-GB"),
+    ("fr", "FR", "FR:fr"),
+    ("es", "ES", "ES:es"),
 ]
 
 # E-Commerce keywords for detection
@@ -87,6 +124,18 @@ ECOMMERCE_KEYWORDS = [
     "webshop", "checkout", "cart", "conversion", "gmv", "buy box"
 ]
 
+# All e-commerce keywords as one alternation: a single C-level scan per text.
+# Substring semantics like the plain `in` checks (no word boundaries).
+ECOMMERCE_RE = re.compile("|".join(map(re.escape, ECOMMERCE_KEYWORDS)), re.IGNORECASE)
+
+# Link filters for IR / earnings index pages (matched against the lowercased URL)
+IR_LINK_RE = re.compile(r'earnings|quarterly|annual|financial|report|results|investor')
+EARNINGS_LINK_RE = re.compile(r'earnings|quarterly|q[1-4]|fy2[0-6]')
+
+# Dates next to index links (IR pages also list "Q1 2024"-style periods)
+IR_DATE_RE = re.compile(r'(\d{4}-\d{2}-\d{2}|\d{2}\.\d{2}\.\d{4}|Q[1-4]\s+\d{4})')
+NEWSROOM_DATE_RE = re.compile(r'(\d{4}-\d{2}-\d{2}|\d{2}\.\d{2}\.\d{4})')
+
 # HTTP headers
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (compatible; EcommerceIntel/2.0; +https://github.com)"
@@ -94,11 +143,334 @@ HEADERS = {
 
 TIMEOUT = 20  # seconds
 
+# Connection pools for the shared HTTP session (hosts cached / connections per host)
+HTTP_POOL_CONNECTIONS = 32
+HTTP_POOL_SIZE = 64
+
+# Transient HTTP errors retried by the session (with exponential backoff)
+HTTP_RETRY_STATUS = (429, 500, 502, 503, 504)
+HTTP_RETRIES = 3
+HTTP_RETRY_BACKOFF = 0.3
+
+# On-disk HTTP cache for index pages, feeds and probes (used when requests-cache
+# is installed and the scraper config enables it). Expired entries are purged whenever
+# the cached session is created, so the file holds at most about one TTL's worth of
+# index/feed responses.
+HTTP_CACHE_PATH = os.environ.get(
+    "SCRAPER_HTTP_CACHE_PATH",
+    os.path.join(user_cache_dir(), "http_cache")
+)
+HTTP_CACHE_TTL = 3600  # seconds before a cached response is revalidated
+HTTP_CACHE_MAX_BYTES = 1_000_000  # larger responses (by Content-Length) are not cached
+
+# Candidate URL probing (HEAD requests, run concurrently)
+PROBE_TIMEOUT = 5  # seconds
+PROBE_WORKERS = 8
+
+# How long a resolved IR/earnings/newsroom URL per domain is trusted (seconds)
+CANDIDATE_CACHE_TTL = 14 * 24 * 3600
+
+# How long enriched page content is reused from the disk cache (seconds)
+ENRICH_CACHE_TTL = 24 * 3600
+
+# Enriched page content gets its own cache file, purged on ENRICH_CACHE_TTL
+# (the main cache keeps candidate URLs for CANDIDATE_CACHE_TTL)
+ENRICH_CACHE_PATH = os.environ.get(
+    "SCRAPER_ENRICH_CACHE_PATH",
+    os.path.join(user_cache_dir(), "enriched.sqlite3")
+)
+
+# Source fields restored from the enrichment cache
+ENRICH_CACHE_FIELDS = (
+    "raw_text", "text_hash", "is_pdf", "is_earnings_report", "has_ecommerce_keywords",
+    "final_url", "http_status_code", "fetch_timestamp"
+)
+
+# PDF parsing limits (the extractor only reads the start of each text)
+PDF_MAX_PAGES = 20
+PDF_MAX_CHARS = 200_000
+
+# HTML pages are read up to this size; the rest is ignored
+MAX_HTML_BYTES = 2_000_000
+HTML_CHUNK_SIZE = 64 * 1024
+
+# Minimum gap between enrichment fetches to the same host (seconds)
+HOST_MIN_INTERVAL = 0.3
+
+# Extracted texts remembered per run by HTML fingerprint (same article under several URLs)
+EXTRACT_MEMO_SIZE = 512
+
+# Parallel Google News feed fetches
+GNEWS_WORKERS = 16
+
+# Parallel workers for content enrichment (override with config "enrich_workers")
+ENRICH_WORKERS = 16
+
+
+# ==============================================================================
+# KEYWORD SCANNING
+# ==============================================================================
+
+def _build_tagged_automaton(keyword_sets: Dict[str, tuple]):
+    """
+    Build one Aho-Corasick automaton over several keyword sets.
+    
+    Args:
+        keyword_sets: Mapping tag -> keywords
+    
+    Returns:
+        Automaton yielding (keyword, tags) per match, or None if pyahocorasick is missing
+    """
+    if ahocorasick is None:
+        return None
+    
+    tags_by_keyword = {}
+    for tag, keywords in keyword_sets.items():
+        for kw in keywords:
+            tags_by_keyword.setdefault(kw, set()).add(tag)
+    
+    automaton = ahocorasick.Automaton()
+    for kw, tags in tags_by_keyword.items():
+        automaton.add_word(kw, (kw, frozenset(tags)))
+    automaton.make_automaton()
+    return automaton
+
+
+_CONTENT_AUTOMATON = _build_tagged_automaton({
+    "ecommerce": ECOMMERCE_KEYWORDS,
+    "earnings": EARNINGS_KEYWORDS,
+})
+
+# E-commerce keywords only (first match answers _has_ecommerce_keywords)
+_ECOMMERCE_AUTOMATON = _build_tagged_automaton({"ecommerce": ECOMMERCE_KEYWORDS})
+
+
+# ==============================================================================
+# DATE PARSING
+# ==============================================================================
+
+def _parse_date(value: str) -> Optional[datetime]:
+    """
+    Parse a feed/page date into an aware datetime (naive → UTC).
+    
+    Tries the formats feeds and index pages actually use before falling
+    back to dateutil: ISO-8601, RFC-822 (RSS pubDate), DD.MM.YYYY.
+    
+    Args:
+        value: Date string
+    
+    Returns:
+        datetime or None if unparseable
+    """
+    if not value:
+        return None
+    
+    value = value.strip()
+    dt = None
+    
+    try:
+        dt = datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith("Z") else value)
+    except ValueError:
+        pass
+    
+    if dt is None:
+        try:
+            dt = parsedate_to_datetime(value)
+        except (TypeError, ValueError, IndexError):
+            pass
+    
+    if dt is None:
+        try:
+            dt = datetime.strptime(value, "%d.%m.%Y")
+        except ValueError:
+            pass
+    
+    if dt is None:
+        try:
+            dt = dateparser.parse(value)
+        except (ValueError, OverflowError):
+            return None
+    
+    if dt and dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+# ==============================================================================
+# FEED PARSING
+# ==============================================================================
+
+# No entity expansion / network access for feeds from the web
+_RSS_PARSER = etree.XMLParser(resolve_entities=False, no_network=True)
+
+
+def _parse_rss_entries(content: bytes) -> list:
+    """
+    Read RSS 2.0 items (title/link/pubDate) with lxml.
+    
+    Google News feeds are plain RSS 2.0; lxml parses them in C (without
+    holding the GIL) instead of feedparser's pure-Python parser, so the
+    concurrent feed fetches don't serialize on parsing. Anything else
+    (Atom, broken XML) goes to feedparser.
+    
+    Args:
+        content: Raw feed bytes
+    
+    Returns:
+        List of entry dicts / feedparser entries (both support .get and [])
+    """
+    try:
+        root = etree.fromstring(content, parser=_RSS_PARSER)
+        items = root.findall("./channel/item")
+    except (etree.XMLSyntaxError, ValueError):
+        items = None
+    
+    if not items:
+        return feedparser.parse(content).entries
+    
+    entries = []
+    for item in items:
+        entry = {
+            "title": item.findtext("title") or "",
+            "link": (item.findtext("link") or "").strip()
+        }
+        published = item.findtext("pubDate")
+        if published:
+            entry["published"] = published
+        entries.append(entry)
+    return entries
+
+
+# ==============================================================================
+# HTML LINK HELPERS
+# ==============================================================================
+
+def _iter_page_links(content: bytes):
+    """
+    Yield (href, element) for every <a> with a non-empty href (lxml, no soup tree).
+    
+    Args:
+        content: Raw HTML bytes (encoding detected by lxml)
+    """
+    if not content or not content.strip():
+        return
+    
+    doc = lxml.html.fromstring(content)
+    for a in doc.iter("a"):
+        href = (a.get("href") or "").strip()
+        if href:
+            yield href, a
+
+
+def _page_origin(url: str) -> str:
+    """"scheme://netloc" of a page URL (base for root-relative links)."""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def _absolute_url(href: str, base_url: str, origin: str) -> str:
+    """
+    Resolve a link found on a page.
+    
+    Absolute and plain root-relative ("/path") links are handled with string
+    ops; only other relative forms go through urljoin.
+    
+    Args:
+        href: Link target as found on the page
+        base_url: Page URL
+        origin: _page_origin(base_url), computed once per page
+    
+    Returns:
+        Absolute URL
+    """
+    if href.startswith(("http://", "https://")):
+        return href
+    if href.startswith("/") and not href.startswith("//") and "/." not in href:
+        return origin + href
+    return urljoin(base_url, href)
+
+
+def _link_text(a) -> str:
+    """Link text with each text node stripped (same as bs4 get_text(strip=True))."""
+    return "".join(t.strip() for t in a.itertext())
+
+
+def _html_to_text(html) -> str:
+    """
+    Visible text of an HTML document or fragment (lxml, no soup tree).
+    
+    Drops script/style/noscript and comments, then joins the stripped text
+    nodes with spaces (same as bs4 get_text(separator=" ", strip=True)).
+    
+    Args:
+        html: HTML markup (str, or bytes with the encoding left to lxml)
+    
+    Returns:
+        Text (empty if the markup has no content)
+    """
+    if not html or not html.strip():
+        return ""
+    
+    try:
+        root = lxml.html.fromstring(html)
+    except ValueError:
+        if isinstance(html, bytes):
+            return ""
+        # str input with an <?xml encoding=...?> declaration
+        root = lxml.html.fromstring(html.encode("utf-8"))
+    except etree.ParserError:
+        return ""
+    
+    dropped = (etree.Comment, "script", "style", "noscript")
+    for el in root.iter(*dropped):
+        if el.tail:
+            el.tail = " " + el.tail  # keep a word break where the element was
+    etree.strip_elements(root, *dropped, with_tail=False)
+    return " ".join(t.strip() for t in root.itertext() if t.strip())
+
 
 # ==============================================================================
 # COMPANY INTELLIGENCE SCRAPER
 # ==============================================================================
 
+class ScraperResources:
+    """
+    Connection-level resources a scraper works with: HTTP sessions, search
+    client and disk caches.
+    
+    All of them are thread-safe, so one instance can back several scrapers
+    running at the same time (the Streamlit app keeps one per process).
+    Per-run state (stats, lookback cutoff, memos) stays on the scraper.
+    """
+    
+    def __init__(self, config: Optional[Dict] = None):
+        """
+        Initialize resources.
+        
+        Args:
+            config: Optional dict with the scraper's disk_cache / http_cache flags
+        """
+        config = config or {}
+        
+        # Initialize Google Search API client
+        self.search_client = GoogleSearchClient()
+        
+        # Shared HTTP session (keep-alive connection pooling; index/feed GETs are cached)
+        self.session = CompanyIntelligenceScraper._build_session(http_cache=config.get("http_cache", False))
+        
+        # Uncached pooled session for streamed article/PDF downloads: requests-cache
+        # reads the whole body before returning, which would defeat MAX_HTML_BYTES
+        self.fetch_session = CompanyIntelligenceScraper._build_session(http_cache=False)
+        
+        # Persistent caches (domain -> resolved candidate URLs; URL -> enriched content).
+        # Separate files, since each purges everything older than its own TTL on open
+        use_disk_cache = config.get("disk_cache", True)
+        self.cache = DiskCache(max_age=CANDIDATE_CACHE_TTL) if use_disk_cache else None
+        self.enrich_cache = (
+            DiskCache(ENRICH_CACHE_PATH, max_age=ENRICH_CACHE_TTL) if use_disk_cache else None
+        )
+
+
 class CompanyIntelligenceScraper:
     """
     Multi-source scraper for company intelligence.
@@ -107,7 +479,12 @@ class CompanyIntelligenceScraper:
     EU/DE markets and E-Commerce.
     """
     
-    def __init__(self, company_name: str, config: Optional[Dict] = None):
+    def __init__(
+        self,
+        company_name: str,
+        config: Optional[Dict] = None,
+        resources: Optional[ScraperResources] = None
+    ):
         """
         Initialize scraper for a company.
         
@@ -119,6 +496,12 @@ class CompanyIntelligenceScraper:
                 - linkedin_url: Direct LinkedIn URL (optional)
                 - lookback_days: Days to look back (default: 14)
                 - max_per_source: Max items per source type (default: 10)
+                - disk_cache: Remember resolved IR/newsroom URLs and enriched content across runs (default: True)
+                - http_cache: Cache index/feed responses on disk if requests-cache is installed
+                  (default: False; the Streamlit app turns it on)
+                - enrich_workers: Concurrent fetches during enrichment (default: ENRICH_WORKERS)
+            resources: Optional shared ScraperResources (built from config if omitted;
+                disk_cache / http_cache are then taken from the resources)
         """
         self.company_name = company_name
         self.config = config or {}
@@ -129,13 +512,91 @@ class CompanyIntelligenceScraper:
         self.linkedin_url = self.config.get("linkedin_url")
         self.lookback_days = self.config.get("lookback_days", 14)
         self.max_per_source = self.config.get("max_per_source", 10)
+        self.enrich_workers = max(1, int(self.config.get("enrich_workers", ENRICH_WORKERS)))
         
         # Calculate lookback
         self.lookback_hours = self.lookback_days * 24
-        self.cutoff_date = datetime.now(timezone.utc) - timedelta(days=self.lookback_days)
         
-        # Initialize Google Search API client
-        self.search_client = GoogleSearchClient()
+        # HTTP sessions, search client and disk caches (possibly shared with other scrapers)
+        resources = resources or ScraperResources(self.config)
+        self.search_client = resources.search_client
+        self.session = resources.session
+        self.fetch_session = resources.fetch_session
+        self.cache = resources.cache
+        self.enrich_cache = resources.enrich_cache
+        
+        self.reset_stats()
+    
+    @staticmethod
+    def _build_session(http_cache: bool = False) -> requests.Session:
+        """
+        Create a pooled requests session with the scraper's default headers.
+        
+        With http_cache (and requests-cache installed) index/feed responses
+        are stored on disk; after HTTP_CACHE_TTL (or the server's
+        Cache-Control) they are revalidated with conditional requests
+        (ETag / If-Modified-Since), so unchanged pages come back as cheap
+        304s. PDFs and large bodies are never cached (_http_cache_filter).
+        """
+        session = None
+        if http_cache and requests_cache is not None:
+            try:
+                ensure_private_dir(os.path.dirname(os.path.abspath(HTTP_CACHE_PATH)))
+                session = requests_cache.CachedSession(
+                    HTTP_CACHE_PATH,
+                    backend="sqlite",
+                    expire_after=HTTP_CACHE_TTL,
+                    cache_control=True,
+                    allowable_methods=("GET", "HEAD"),
+                    filter_fn=CompanyIntelligenceScraper._http_cache_filter
+                )
+                session.cache.delete(expired=True)
+            except Exception as e:
+                logger.warning(f"HTTP cache disabled ({HTTP_CACHE_PATH}): {e}")
+                session = None
+        if session is None:
+            session = requests.Session()
+        session.headers.update(HEADERS)
+        
+        # Retry 429/5xx (honouring Retry-After) and one failed connect; read
+        # timeouts are not retried so a slow host costs at most one TIMEOUT.
+        # After the last retry the error response is returned as usual.
+        retry = Retry(
+            total=HTTP_RETRIES,
+            connect=1,
+            read=0,
+            backoff_factor=HTTP_RETRY_BACKOFF,
+            status_forcelist=HTTP_RETRY_STATUS,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=HTTP_POOL_SIZE,
+            max_retries=retry
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+    
+    @staticmethod
+    def _http_cache_filter(response) -> bool:
+        """requests-cache filter_fn: only cache small non-PDF responses (headers only, body unread)."""
+        content_type = response.headers.get("Content-Type", "").lower()
+        if "application/pdf" in content_type:
+            return False
+        length = response.headers.get("Content-Length")
+        return not (length and length.isdigit() and int(length) > HTTP_CACHE_MAX_BYTES)
+    
+    def reset_stats(self):
+        """
+        Reset per-run state (statistics and lookback cutoff).
+        
+        Call before each discover_all_sources() when the scraper instance
+        is reused across runs. Not safe while another run on the same
+        instance is in progress; concurrent runs use separate scrapers
+        (sharing ScraperResources).
+        """
+        self.cutoff_date = datetime.now(timezone.utc) - timedelta(days=self.lookback_days)
         
         # Statistics
         self.stats = {
@@ -148,6 +609,14 @@ class CompanyIntelligenceScraper:
             "errors": [],
             "search_api_enabled": self.search_client.enabled
         }
+        
+        # HTML fingerprint -> (extracted text, text hash), see _extract_text_memoized
+        self._extracted_texts = {}
+        self._extracted_lock = threading.Lock()
+        
+        # Per-host rate limiting during enrichment (see _wait_for_host)
+        self._host_next_slot = {}
+        self._host_lock = threading.Lock()
     
     # ==========================================================================
     # MAIN ORCHESTRATOR
@@ -174,95 +643,60 @@ class CompanyIntelligenceScraper:
         """
         all_sources = []
         
-        print(f"\n🔍 Discovering sources for: {self.company_name}")
-        print(f"   Domain: {self.domain}")
-        print(f"   Lookback: {self.lookback_days} days")
-        print(f"\n💡 Strategy: IR > Earnings > Direct Newsroom > Bing News (Fallback)")
+        logger.info(f"🔍 Discovering sources for: {self.company_name}")
+        logger.info(f"   Domain: {self.domain}")
+        logger.info(f"   Lookback: {self.lookback_days} days")
+        logger.info(f"💡 Strategy: IR > Earnings > Direct Newsroom > Bing News (Fallback)")
+        
+        # Channels in priority order:
+        # (stats key, label, discover fn, success line, error label, non-critical)
+        channels = [
+            ("investor_relations", "📊 [P1] Investor Relations", self._discover_investor_relations,
+             "IR pages (HIGH QUALITY)", "IR discovery failed", False),
+            ("earnings_reports", "📈 [P2] Earnings Reports", self._discover_earnings_reports,
+             "earnings reports (FINANCIAL DATA)", "Earnings discovery failed", False),
+            ("direct_newsroom", "🏢 [P3] Direct Newsroom RSS", self._discover_direct_newsroom,
+             "newsroom articles (OFFICIAL)", "Direct newsroom failed", False),
+            ("bing_news", "🌐 [P4] Bing News (Fallback)", self._discover_bing_news,
+             "Bing news articles (SUPPLEMENT)", "Bing News failed", True),
+            ("linkedin", "💼 [P5] LinkedIn (Fallback)", self._discover_linkedin,
+             "LinkedIn posts (SOCIAL)", "LinkedIn failed", True),
+        ]
         
-        # ==========================================
-        # PRIORITY 1: INVESTOR RELATIONS
-        # ==========================================
-        print("\n📊 [P1] Investor Relations...")
-        try:
-            ir_sources = self._discover_investor_relations()
-            all_sources.extend(ir_sources)
-            self.stats["investor_relations"] = len(ir_sources)
-            print(f"   ✓ Found {len(ir_sources)} IR pages (HIGH QUALITY)")
-        except Exception as e:
-            error_msg = f"IR discovery failed: {e}"
-            print(f"   ✗ {error_msg}")
-            self.stats["errors"].append(error_msg)
-        
-        # ==========================================
-        # PRIORITY 2: EARNINGS REPORTS (PDFs)
-        # ==========================================
-        print("\n📈 [P2] Earnings Reports...")
-        try:
-            earnings_sources = self._discover_earnings_reports()
-            all_sources.extend(earnings_sources)
-            self.stats["earnings_reports"] = len(earnings_sources)
-            print(f"   ✓ Found {len(earnings_sources)} earnings reports (FINANCIAL DATA)")
-        except Exception as e:
-            error_msg = f"Earnings discovery failed: {e}"
-            print(f"   ✗ {error_msg}")
-            self.stats["errors"].append(error_msg)
-        
-        # ==========================================
-        # PRIORITY 3: DIRECT NEWSROOM (NO GOOGLE)
-        # ==========================================
-        print("\n🏢 [P3] Direct Newsroom RSS...")
-        try:
-            newsroom_sources = self._discover_direct_newsroom()
-            all_sources.extend(newsroom_sources)
-            self.stats["direct_newsroom"] = len(newsroom_sources)
-            print(f"   ✓ Found {len(newsroom_sources)} newsroom articles (OFFICIAL)")
-        except Exception as e:
-            error_msg = f"Direct newsroom failed: {e}"
-            print(f"   ✗ {error_msg}")
-            self.stats["errors"].append(error_msg)
-        
-        # ==========================================
-        # PRIORITY 4: BING NEWS (FALLBACK)
-        # ==========================================
-        print("\n🌐 [P4] Bing News (Fallback)...")
-        try:
-            bing_sources = self._discover_bing_news()
-            all_sources.extend(bing_sources)
-            self.stats["bing_news"] = len(bing_sources)
-            print(f"   ✓ Found {len(bing_sources)} Bing news articles (SUPPLEMENT)")
-        except Exception as e:
-            error_msg = f"Bing News failed: {e}"
-            print(f"   ℹ️  {error_msg} (non-critical)")
-            self.stats["errors"].append(error_msg)
-        
-        # ==========================================
-        # PRIORITY 5: LINKEDIN (FALLBACK)
-        # ==========================================
-        print("\n💼 [P5] LinkedIn (Fallback)...")
-        try:
-            linkedin_sources = self._discover_linkedin()
-            all_sources.extend(linkedin_sources)
-            self.stats["linkedin"] = len(linkedin_sources)
-            print(f"   ✓ Found {len(linkedin_sources)} LinkedIn posts (SOCIAL)")
-        except Exception as e:
-            error_msg = f"LinkedIn failed: {e}"
-            print(f"   ℹ️  {error_msg} (non-critical)")
-            self.stats["errors"].append(error_msg)
+        # All channels are I/O-bound and independent: run them concurrently,
+        # then collect in priority order (dedupe keeps the first occurrence)
+        with ThreadPoolExecutor(max_workers=len(channels), thread_name_prefix="discover") as pool:
+            futures = [pool.submit(fn) for _, _, fn, _, _, _ in channels]
+            
+            for (key, label, _, found_msg, error_label, non_critical), future in zip(channels, futures):
+                logger.info(f"{label}...")
+                try:
+                    channel_sources = future.result()
+                    all_sources.extend(channel_sources)
+                    self.stats[key] = len(channel_sources)
+                    logger.info(f"   ✓ Found {len(channel_sources)} {found_msg}")
+                except Exception as e:
+                    error_msg = f"{error_label}: {e}"
+                    if non_critical:
+                        logger.info(f"   ℹ️  {error_msg} (non-critical)")
+                    else:
+                        logger.warning(f"   ✗ {error_msg}")
+                    self.stats["errors"].append(error_msg)
         
         # Deduplicate by URL
         all_sources = self._deduplicate_sources(all_sources)
         
-        print(f"\n✅ Total sources discovered: {len(all_sources)}")
-        print(f"   📊 IR Pages: {self.stats['investor_relations']}")
-        print(f"   📈 Earnings: {self.stats['earnings_reports']}")
-        print(f"   🏢 Newsroom: {self.stats['direct_newsroom']}")
-        print(f"   🌐 Bing: {self.stats['bing_news']}")
-        print(f"   💼 LinkedIn: {self.stats['linkedin']}")
+        logger.info(f"✅ Total sources discovered: {len(all_sources)}")
+        logger.info(f"   📊 IR Pages: {self.stats['investor_relations']}")
+        logger.info(f"   📈 Earnings: {self.stats['earnings_reports']}")
+        logger.info(f"   🏢 Newsroom: {self.stats['direct_newsroom']}")
+        logger.info(f"   🌐 Bing: {self.stats['bing_news']}")
+        logger.info(f"   💼 LinkedIn: {self.stats['linkedin']}")
         
         if self.stats["errors"]:
-            print(f"\n⚠️  Errors: {len(self.stats['errors'])}")
+            logger.warning(f"⚠️  Errors: {len(self.stats['errors'])}")
             for err in self.stats["errors"][:2]:
-                print(f"   - {err[:80]}...")
+                logger.info(f"   - {err[:80]}...")
         
         # Fetch full content for each source
         if not all_sources:
@@ -271,9 +705,9 @@ class CompanyIntelligenceScraper:
                 error_msg += f"\nErrors: {', '.join(self.stats['errors'][:2])}"
             raise Exception(error_msg)
         
-        print(f"\n📥 Fetching content for {len(all_sources)} sources...")
+        logger.info(f"📥 Fetching content for {len(all_sources)} sources...")
         all_sources = self.enrich_sources(all_sources)
-        print(f"✅ Successfully enriched {len(all_sources)} sources with content")
+        logger.info(f"✅ Successfully enriched {len(all_sources)} sources with content")
         
         if not all_sources:
             raise Exception(
@@ -288,36 +722,49 @@ class CompanyIntelligenceScraper:
     # ==========================================================================
     
     def _discover_google_news(self) -> List[Dict]:
-        """Discover via Google News RSS (EU editions + E-Commerce queries)."""
+        """
+        Discover via Google News RSS (EU editions + E-Commerce queries).
+        
+        Not a discover_all_sources() channel (kept for direct use); the live
+        Google News fetches are the LinkedIn fallback's _parse_gnews_feed calls.
+        """
         sources = []
         
+        # Feeds to fetch: (url, source tag, error label or None for silent fail)
+        feeds = []
+        
         # Base query: Company name
         base_query = f'"{self.company_name}"'
         
         # 1. Generic company query across EU editions
         for lang, gl, ceid in EU_GNEWS_EDITIONS:
-            try:
-                url = self._build_gnews_url(base_query, lang, gl, ceid)
-                items = self._parse_gnews_feed(url, f"gnews:{gl.lower()}:{lang}")
-                sources.extend(items[:self.max_per_source])
-            except Exception as e:
-                self.stats["errors"].append(f"GNews {gl} failed: {e}")
-                continue
+            url = self._build_gnews_url(base_query, lang, gl, ceid)
+            feeds.append((url, f"gnews:{gl.lower()}:{lang}", f"GNews {gl}"))
         
         # 2. E-Commerce focused queries
-        for template in ECOMMERCE_QUERY_TEMPLATES:
+        # Key EU markets only, each with the template in its own language
+        # (other-language queries mostly returned noise)
+        for lang, gl, ceid in ECOMMERCE_KEY_MARKETS:
+            template = ECOMMERCE_QUERY_TEMPLATES.get(
+                lang.split("-")[0], ECOMMERCE_QUERY_TEMPLATES["en"]
+            )
             query = template.format(company=self.company_name)
-            
-            # Query across key EU markets only (to avoid too many requests)
-            key_markets = [("de", "DE", "DE:de"), ("en-GB", "GB", "GB:en-GB"), ("fr", "FR", "FR:fr")]
-            
-            for lang, gl, ceid in key_markets:
-                try:
-                    url = self._build_gnews_url(query, lang, gl, ceid)
-                    items = self._parse_gnews_feed(url, f"gnews-ecom:{gl.lower()}:{lang}")
-                    sources.extend(items[:self.max_per_source])
-                except Exception as e:
-                    continue  # Silent fail for e-commerce queries (optional)
+            url = self._build_gnews_url(query, lang, gl, ceid)
+            feeds.append((url, f"gnews-ecom:{gl.lower()}:{lang}", None))  # optional
+        
+        def fetch(feed):
+            url, tag, _ = feed
+            try:
+                return self._parse_gnews_feed(url, tag, limit=self.max_per_source), None
+            except Exception as e:
+                return [], e
+        
+        # Fetch all feeds concurrently; results are merged in the order above
+        with ThreadPoolExecutor(max_workers=min(GNEWS_WORKERS, len(feeds)), thread_name_prefix="gnews") as pool:
+            for (_, _, error_label), (items, error) in zip(feeds, pool.map(fetch, feeds)):
+                sources.extend(items)
+                if error is not None and error_label:
+                    self.stats["errors"].append(f"{error_label} failed: {error}")
         
         return sources
     
@@ -335,13 +782,25 @@ class CompanyIntelligenceScraper:
         
         return f"https://news.google.com/rss/search?{urlencode(params)}"
     
-    def _parse_gnews_feed(self, url: str, source_tag: str) -> List[Dict]:
-        """Parse Google News RSS feed."""
+    def _parse_gnews_feed(self, url: str, source_tag: str, limit: Optional[int] = None) -> List[Dict]:
+        """
+        Parse Google News RSS feed.
+        
+        Args:
+            url: Feed URL
+            source_tag: Value for each item's "source" field
+            limit: Stop after this many items (None = all entries)
+        
+        Returns:
+            List of source dicts
+        """
         try:
-            feed = feedparser.parse(url)
+            # Fetch via the shared session (pooled, cached), parse the bytes
+            response = self.session.get(url, timeout=TIMEOUT, allow_redirects=True)
+            response.raise_for_status()
             items = []
             
-            for entry in feed.entries:
+            for entry in _parse_rss_entries(response.content):
                 link = entry.get("link", "")
                 if not link:
                     continue
@@ -352,14 +811,9 @@ class CompanyIntelligenceScraper:
                 published_at = None
                 for date_field in ("published", "updated"):
                     if date_field in entry:
-                        try:
-                            dt = dateparser.parse(entry[date_field])
-                            if dt and dt.tzinfo is None:
-                                dt = dt.replace(tzinfo=timezone.utc)
-                            published_at = dt
+                        published_at = _parse_date(entry[date_field])
+                        if published_at:
                             break
-                        except Exception:
-                            continue
                 
                 items.append({
                     "url": link,
@@ -367,6 +821,10 @@ class CompanyIntelligenceScraper:
                     "source": source_tag,
                     "published_at": published_at.isoformat() if published_at else None
                 })
+                
+                # Don't parse dates of entries the caller would drop
+                if limit and len(items) >= limit:
+                    break
             
             return items
         except Exception as e:
@@ -406,8 +864,8 @@ class CompanyIntelligenceScraper:
                 }
                 url = f"https://news.google.com/rss/search?{urlencode(params)}"
                 
-                items = self._parse_gnews_feed(url, f"linkedin:gnews:{gl.lower()}")
-                sources.extend(items[:self.max_per_source])
+                items = self._parse_gnews_feed(url, f"linkedin:gnews:{gl.lower()}", limit=self.max_per_source)
+                sources.extend(items)
             except Exception:
                 continue
         
@@ -437,7 +895,7 @@ class CompanyIntelligenceScraper:
         # STRATEGY 1: Google Search API (BEST!)
         # ==================================================
         if self.search_client.enabled:
-            print(f"   🔍 Using Google Search API to find IR page...")
+            logger.info(f"   🔍 Using Google Search API to find IR page...")
             try:
                 search_results = self.search_client.search_investor_relations(
                     company=self.company_name,
@@ -445,104 +903,161 @@ class CompanyIntelligenceScraper:
                 )
                 
                 if search_results:
-                    print(f"   ✓ Google Search found {len(search_results)} IR candidates")
+                    logger.info(f"   ✓ Google Search found {len(search_results)} IR candidates")
                     
                     # Try each search result
                     for result in search_results[:5]:  # Top 5 results
                         url = result['link']
                         try:
-                            print(f"      Testing: {url[:60]}...")
+                            logger.info(f"      Testing: {url[:60]}...")
                             items = self._scrape_ir_index(url)
                             sources.extend(items)
                             
                             if items:
-                                print(f"      ✓ SUCCESS! Found {len(items)} IR items")
+                                logger.info(f"      ✓ SUCCESS! Found {len(items)} IR items")
                                 return sources  # Found IR page with content, stop
                         except Exception as e:
-                            print(f"      ✗ Failed: {str(e)[:50]}")
+                            logger.warning(f"      ✗ Failed: {str(e)[:50]}")
                             continue
                 else:
-                    print(f"   ⚠️  Google Search found no IR pages")
+                    logger.warning(f"   ⚠️  Google Search found no IR pages")
             except Exception as e:
-                print(f"   ⚠️  Google Search failed: {str(e)[:80]}")
+                logger.warning(f"   ⚠️  Google Search failed: {str(e)[:80]}")
                 self.stats["errors"].append(f"Search API IR failed: {e}")
         
         # ==================================================
         # STRATEGY 2: URL Guessing (FALLBACK)
         # ==================================================
         if not sources:
-            print(f"   📍 Falling back to URL guessing...")
+            logger.info(f"   📍 Falling back to URL guessing...")
             candidates = build_investor_relations_candidates(self.domain)
             
-            for candidate_url in candidates[:10]:  # Check top 10 most likely
-                try:
-                    response = requests.head(candidate_url, headers=HEADERS, timeout=5, allow_redirects=True)
-                    
-                    if response.status_code < 400:
-                        print(f"      ✓ Found IR page: {candidate_url}")
-                        items = self._scrape_ir_index(candidate_url)
-                        sources.extend(items)
-                        
-                        if items:
-                            return sources  # Found IR page with content, stop
-                except Exception:
-                    continue
+            # Check top 10 most likely
+            sources.extend(self._resolve_candidate(
+                "ir", "IR page", candidates[:10], self._scrape_ir_index
+            ))
         
         return sources
     
+    def _resolve_candidate(self, kind: str, label: str, candidates: List[str], scrape) -> List[Dict]:
+        """
+        Scrape the first candidate URL that yields items.
+        
+        The winning URL is remembered per domain on disk, so repeat runs try it
+        directly and skip the HEAD probes; a cached URL that no longer yields
+        items is dropped and the candidates are probed again.
+        
+        Args:
+            kind: Cache namespace ("ir", "earnings", "newsroom")
+            label: Name for log output
+            candidates: Candidate URLs in priority order
+            scrape: Scrape function (url -> list of items)
+        
+        Returns:
+            Items from the first productive candidate (empty if none)
+        """
+        cache_key = f"candidate:{kind}:{self.domain}"
+        
+        cached_url = self.cache.get(cache_key, max_age=CANDIDATE_CACHE_TTL) if self.cache else None
+        if cached_url:
+            try:
+                items = scrape(cached_url)
+                if items:
+                    logger.info(f"      ✓ Cached {label}: {cached_url}")
+                    return items
+            except Exception:
+                pass
+            self.cache.delete(cache_key)
+        
+        # Probe all candidates at once, then scrape reachable ones in priority order
+        for candidate_url in self._probe_candidates(candidates):
+            if candidate_url == cached_url:
+                continue  # Just failed above
+            try:
+                logger.info(f"      ✓ Found {label}: {candidate_url}")
+                items = scrape(candidate_url)
+                
+                if items:
+                    if self.cache:
+                        self.cache.set(cache_key, candidate_url)
+                    return items  # Found page with content, stop
+            except Exception:
+                continue
+        
+        return []
+    
+    def _probe_candidates(self, candidates: List[str]):
+        """
+        HEAD-probe candidate URLs concurrently.
+        
+        Each reachable candidate is yielded as soon as it and every
+        higher-priority candidate have answered, so the caller can stop at
+        the first productive one; probes still running then are abandoned.
+        
+        Args:
+            candidates: Candidate URLs in priority order
+        
+        Yields:
+            Reachable candidates (status < 400), in the original order
+        """
+        def probe(url: str) -> bool:
+            try:
+                response = self.session.head(url, timeout=PROBE_TIMEOUT, allow_redirects=True)
+                return response.status_code < 400
+            except Exception:
+                return False
+        
+        if not candidates:
+            return
+        
+        pool = ThreadPoolExecutor(max_workers=min(PROBE_WORKERS, len(candidates)))
+        try:
+            futures = [pool.submit(probe, url) for url in candidates]
+            for url, future in zip(candidates, futures):
+                if future.result():
+                    yield url
+        finally:
+            # Runs when the caller stops early (generator closed) or on exhaustion
+            pool.shutdown(wait=False, cancel_futures=True)
+    
     def _scrape_ir_index(self, url: str) -> List[Dict]:
         """Scrape IR index page for reports and articles."""
         try:
-            response = requests.get(url, headers=HEADERS, timeout=TIMEOUT, allow_redirects=True)
+            response = self.session.get(url, timeout=TIMEOUT, allow_redirects=True)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, "html.parser")
             items = []
+            seen = set()  # pages often link the same document several times
+            
+            origin = _page_origin(url)
             
             # Find all links
-            for link in soup.find_all("a", href=True):
-                href = link.get("href", "").strip()
-                if not href:
-                    continue
-                
+            for href, link in _iter_page_links(response.content):
                 # Make absolute URL
-                if not href.startswith("http"):
-                    href = urljoin(url, href)
+                href = _absolute_url(href, url, origin)
                 
                 if not is_valid_url(href):
                     continue
                 
                 # Filter: Prioritize earnings/financial report URLs
-                url_lower = href.lower()
-                is_relevant = (
-                    'earnings' in url_lower or
-                    'quarterly' in url_lower or
-                    'annual' in url_lower or
-                    'financial' in url_lower or
-                    'report' in url_lower or
-                    'results' in url_lower or
-                    'investor' in url_lower
-                )
-                
-                if not is_relevant:
+                if not IR_LINK_RE.search(href.lower()):
                     continue  # Skip non-relevant links
                 
-                title = link.get_text(strip=True) or "IR Document"
+                canonical = canonicalize_url(href)
+                if canonical in seen:
+                    continue
+                seen.add(canonical)
+                
+                title = _link_text(link) or "IR Document"
                 
                 # Try to extract date
                 published_at = None
-                parent = link.find_parent()
-                if parent:
-                    text = parent.get_text()
-                    date_match = re.search(r'(\d{4}-\d{2}-\d{2}|\d{2}\.\d{2}\.\d{4}|Q[1-4]\s+\d{4})', text)
+                parent = link.getparent()
+                if parent is not None:
+                    text = parent.text_content()
+                    date_match = IR_DATE_RE.search(text)
                     if date_match:
-                        try:
-                            dt = dateparser.parse(date_match.group(1))
-                            if dt and dt.tzinfo is None:
-                                dt = dt.replace(tzinfo=timezone.utc)
-                            published_at = dt
-                        except Exception:
-                            pass
+                        published_at = _parse_date(date_match.group(1))
                 
                 items.append({
                     "url": href,
@@ -580,7 +1095,7 @@ class CompanyIntelligenceScraper:
         # STRATEGY 1: Google Search API (BEST!)
         # ==================================================
         if self.search_client.enabled:
-            print(f"   🔍 Using Google Search API to find earnings reports...")
+            logger.info(f"   🔍 Using Google Search API to find earnings reports...")
             try:
                 search_results = self.search_client.search_earnings_reports(
                     company=self.company_name,
@@ -588,7 +1103,7 @@ class CompanyIntelligenceScraper:
                 )
                 
                 if search_results:
-                    print(f"   ✓ Google Search found {len(search_results)} earnings candidates")
+                    logger.info(f"   ✓ Google Search found {len(search_results)} earnings candidates")
                     
                     # Try each search result
                     for result in search_results[:5]:  # Top 5 results
@@ -596,7 +1111,7 @@ class CompanyIntelligenceScraper:
                         
                         # If it's a direct PDF link, add it directly
                         if is_pdf_url(url):
-                            print(f"      ✓ Direct PDF: {url[:60]}...")
+                            logger.info(f"      ✓ Direct PDF: {url[:60]}...")
                             sources.append({
                                 "url": url,
                                 "title": result['title'],
@@ -610,81 +1125,64 @@ class CompanyIntelligenceScraper:
                         else:
                             # If it's an index page, scrape it
                             try:
-                                print(f"      Testing: {url[:60]}...")
+                                logger.info(f"      Testing: {url[:60]}...")
                                 items = self._scrape_earnings_index(url)
                                 sources.extend(items)
                                 
                                 if items:
-                                    print(f"      ✓ SUCCESS! Found {len(items)} earnings items")
+                                    logger.info(f"      ✓ SUCCESS! Found {len(items)} earnings items")
                                     return sources
                             except Exception as e:
-                                print(f"      ✗ Failed: {str(e)[:50]}")
+                                logger.warning(f"      ✗ Failed: {str(e)[:50]}")
                                 continue
                 else:
-                    print(f"   ⚠️  Google Search found no earnings reports")
+                    logger.warning(f"   ⚠️  Google Search found no earnings reports")
             except Exception as e:
-                print(f"   ⚠️  Google Search failed: {str(e)[:80]}")
+                logger.warning(f"   ⚠️  Google Search failed: {str(e)[:80]}")
                 self.stats["errors"].append(f"Search API Earnings failed: {e}")
         
         # ==================================================
         # STRATEGY 2: URL Guessing (FALLBACK)
         # ==================================================
         if not sources:
-            print(f"   📍 Falling back to URL guessing...")
+            logger.info(f"   📍 Falling back to URL guessing...")
             candidates = build_earnings_report_candidates(self.domain)
             
-            for candidate_url in candidates[:8]:  # Check top 8
-                try:
-                    response = requests.head(candidate_url, headers=HEADERS, timeout=5, allow_redirects=True)
-                    
-                    if response.status_code < 400:
-                        print(f"      ✓ Found earnings page: {candidate_url}")
-                        items = self._scrape_earnings_index(candidate_url)
-                        sources.extend(items)
-                        
-                        if items:
-                            return sources  # Found earnings page, stop
-                except Exception:
-                    continue
+            # Check top 8
+            sources.extend(self._resolve_candidate(
+                "earnings", "earnings page", candidates[:8], self._scrape_earnings_index
+            ))
         
         return sources
     
     def _scrape_earnings_index(self, url: str) -> List[Dict]:
         """Scrape earnings report index page."""
         try:
-            response = requests.get(url, headers=HEADERS, timeout=TIMEOUT, allow_redirects=True)
+            response = self.session.get(url, timeout=TIMEOUT, allow_redirects=True)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, "html.parser")
             items = []
+            seen = set()
+            origin = _page_origin(url)
             
-            for link in soup.find_all("a", href=True):
-                href = link.get("href", "").strip()
-                if not href:
-                    continue
-                
+            for href, link in _iter_page_links(response.content):
                 # Make absolute URL
-                if not href.startswith("http"):
-                    href = urljoin(url, href)
+                href = _absolute_url(href, url, origin)
                 
                 if not is_valid_url(href):
                     continue
                 
                 # Prioritize PDFs and earnings-related links
-                url_lower = href.lower()
-                is_earnings = (
-                    is_pdf_url(href) or
-                    'earnings' in url_lower or
-                    'quarterly' in url_lower or
-                    'q1' in url_lower or 'q2' in url_lower or 'q3' in url_lower or 'q4' in url_lower or
-                    'fy20' in url_lower or 'fy21' in url_lower or 'fy22' in url_lower or 
-                    'fy23' in url_lower or 'fy24' in url_lower or 'fy25' in url_lower or 'fy26' in url_lower
-                )
+                is_pdf = is_pdf_url(href)
+                if not (is_pdf or EARNINGS_LINK_RE.search(href.lower())):
+                    continue
                 
-                if not is_earnings:
+                canonical = canonicalize_url(href)
+                if canonical in seen:
                     continue
+                seen.add(canonical)
                 
-                title = link.get_text(strip=True) or "Earnings Report"
+                title = _link_text(link) or "Earnings Report"
                 
                 items.append({
                     "url": href,
@@ -692,7 +1190,7 @@ class CompanyIntelligenceScraper:
                     "source": "earnings_report",
                     "published_at": None,
                     "priority": 2,
-                    "is_pdf": is_pdf_url(href)
+                    "is_pdf": is_pdf
                 })
                 
                 if len(items) >= self.max_per_source:
@@ -730,13 +1228,13 @@ class CompanyIntelligenceScraper:
                 sources.extend(items)
                 return sources
             except Exception as e:
-                print(f"   ⚠️  Provided newsroom URL failed: {e}")
+                logger.warning(f"   ⚠️  Provided newsroom URL failed: {e}")
         
         # ==================================================
         # STRATEGY 2: Google Search API (BEST!)
         # ==================================================
         if self.search_client.enabled:
-            print(f"   🔍 Using Google Search API to find newsroom...")
+            logger.info(f"   🔍 Using Google Search API to find newsroom...")
             try:
                 # Search for newsroom/press pages
                 search_results = self.search_client.search(
@@ -745,47 +1243,38 @@ class CompanyIntelligenceScraper:
                 )
                 
                 if search_results:
-                    print(f"   ✓ Google Search found {len(search_results)} newsroom candidates")
+                    logger.info(f"   ✓ Google Search found {len(search_results)} newsroom candidates")
                     
                     for result in search_results[:3]:  # Top 3 results
                         url = result['link']
                         try:
-                            print(f"      Testing: {url[:60]}...")
+                            logger.info(f"      Testing: {url[:60]}...")
                             items = self._scrape_newsroom_rss_or_index(url)
                             sources.extend(items)
                             
                             if items:
-                                print(f"      ✓ SUCCESS! Found {len(items)} newsroom items")
+                                logger.info(f"      ✓ SUCCESS! Found {len(items)} newsroom items")
                                 return sources
                         except Exception as e:
-                            print(f"      ✗ Failed: {str(e)[:50]}")
+                            logger.warning(f"      ✗ Failed: {str(e)[:50]}")
                             continue
                 else:
-                    print(f"   ⚠️  Google Search found no newsroom pages")
+                    logger.warning(f"   ⚠️  Google Search found no newsroom pages")
             except Exception as e:
-                print(f"   ⚠️  Google Search failed: {str(e)[:80]}")
+                logger.warning(f"   ⚠️  Google Search failed: {str(e)[:80]}")
                 self.stats["errors"].append(f"Search API Newsroom failed: {e}")
         
         # ==================================================
         # STRATEGY 3: URL Guessing (FALLBACK)
         # ==================================================
         if not sources:
-            print(f"   📍 Falling back to URL guessing...")
+            logger.info(f"   📍 Falling back to URL guessing...")
             candidates = build_newsroom_candidates(self.domain)
             
-            for candidate_url in candidates[:6]:  # Check top 6
-                try:
-                    response = requests.head(candidate_url, headers=HEADERS, timeout=5, allow_redirects=True)
-                    
-                    if response.status_code < 400:
-                        print(f"      ✓ Found newsroom: {candidate_url}")
-                        items = self._scrape_newsroom_rss_or_index(candidate_url)
-                        sources.extend(items)
-                        
-                        if items:
-                            return sources  # Found newsroom, stop
-                except Exception:
-                    continue
+            # Check top 6
+            sources.extend(self._resolve_candidate(
+                "newsroom", "newsroom", candidates[:6], self._scrape_newsroom_rss_or_index
+            ))
         
         return sources
     
@@ -800,18 +1289,31 @@ class CompanyIntelligenceScraper:
             f"{url}/atom.xml",
         ]
         
-        for rss_url in rss_candidates:
-            try:
-                feed = feedparser.parse(rss_url)
-                if feed.entries:
-                    print(f"      ✓ Found RSS feed: {rss_url}")
+        # Fetch all candidates at once; the first one (in order) with entries wins
+        pool = ThreadPoolExecutor(max_workers=len(rss_candidates))
+        try:
+            futures = [pool.submit(self._fetch_feed, rss_url) for rss_url in rss_candidates]
+            for rss_url, future in zip(rss_candidates, futures):
+                feed = future.result()
+                if feed is not None and feed.entries:
+                    logger.info(f"      ✓ Found RSS feed: {rss_url}")
                     return self._parse_newsroom_rss(feed)
-            except Exception:
-                continue
+        finally:
+            # Don't wait for slower candidates once a feed was found
+            pool.shutdown(wait=False, cancel_futures=True)
         
         # Fallback: HTML scraping
         return self._scrape_newsroom_index(url)
     
+    def _fetch_feed(self, url: str):
+        """Fetch and parse an RSS/Atom feed via the shared session (None on failure)."""
+        try:
+            response = self.session.get(url, timeout=TIMEOUT, allow_redirects=True)
+            response.raise_for_status()
+            return feedparser.parse(response.content)
+        except Exception:
+            return None
+    
     def _parse_newsroom_rss(self, feed) -> List[Dict]:
         """Parse newsroom RSS feed."""
         items = []
@@ -827,14 +1329,9 @@ class CompanyIntelligenceScraper:
             published_at = None
             for date_field in ("published", "updated"):
                 if date_field in entry:
-                    try:
-                        dt = dateparser.parse(entry[date_field])
-                        if dt and dt.tzinfo is None:
-                            dt = dt.replace(tzinfo=timezone.utc)
-                        published_at = dt
+                    published_at = _parse_date(entry[date_field])
+                    if published_at:
                         break
-                    except Exception:
-                        continue
             
             items.append({
                 "url": link,
@@ -878,49 +1375,47 @@ class CompanyIntelligenceScraper:
     def _scrape_newsroom_index(self, url: str) -> List[Dict]:
         """Scrape newsroom index page for article links."""
         try:
-            response = requests.get(url, headers=HEADERS, timeout=TIMEOUT)
+            response = self.session.get(url, timeout=TIMEOUT)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, "html.parser")
             items = []
+            seen = set()
             
-            # Find all links
-            for link in soup.find_all("a", href=True):
-                href = link.get("href", "").strip()
-                if not href:
-                    continue
-                
+            # Loop invariants
+            origin = _page_origin(url)
+            base_domain = extract_domain(url)
+            
+            # Find all links (streamed from lxml, no soup tree; parents are
+            # kept for the date lookup below)
+            for href, link in _iter_page_links(response.content):
                 # Make absolute URL
-                if not href.startswith("http"):
-                    href = urljoin(url, href)
+                href = _absolute_url(href, url, origin)
                 
                 # Filter: Must be from same domain and look like article
                 if not is_valid_url(href):
                     continue
                 
-                domain = extract_domain(href)
-                if domain != extract_domain(url):
+                if extract_domain(href) != base_domain:
                     continue  # External link
                 
+                canonical = canonicalize_url(href)
+                if canonical in seen:
+                    continue
+                seen.add(canonical)
+                
                 # Get title
-                title = link.get_text(strip=True) or "News Article"
+                title = _link_text(link) or "News Article"
                 
                 # Try to find date (naive approach)
                 published_at = None
                 # Look for nearby date indicators
-                parent = link.find_parent()
-                if parent:
-                    text = parent.get_text()
+                parent = link.getparent()
+                if parent is not None:
+                    text = parent.text_content()
                     # Simple regex for dates like 2024-01-19 or 19.01.2024
-                    date_match = re.search(r'(\d{4}-\d{2}-\d{2}|\d{2}\.\d{2}\.\d{4})', text)
+                    date_match = NEWSROOM_DATE_RE.search(text)
                     if date_match:
-                        try:
-                            dt = dateparser.parse(date_match.group(1))
-                            if dt and dt.tzinfo is None:
-                                dt = dt.replace(tzinfo=timezone.utc)
-                            published_at = dt
-                        except Exception:
-                            pass
+                        published_at = _parse_date(date_match.group(1))
                 
                 items.append({
                     "url": href,
@@ -961,41 +1456,104 @@ class CompanyIntelligenceScraper:
                 - is_pdf: bool
                 - is_earnings_report: bool (if PDF)
         """
+        logger.info(f"📄 Enriching {len(sources)} sources...")
+        
         enriched = []
         success_count = 0
         
-        print(f"\n📄 Enriching {len(sources)} sources...")
+        for i, (source, ok) in enumerate(self.iter_enriched_sources(sources), 1):
+            enriched.append(source)
+            success_count += ok
+            
+            if i % 10 == 0:
+                logger.info(f"   {i}/{len(sources)} processed...")
+        
+        logger.info(f"✅ Enriched {success_count}/{len(sources)} sources successfully")
+        logger.info(f"   Kept {len(enriched)} total sources (including failures)")
+        
+        return enriched
+    
+    def iter_enriched_sources(self, sources: List[Dict]):
+        """
+        Enrich sources concurrently, yielding each one as soon as it is done.
+        
+        Lets callers process or persist sources while later ones are still
+        being fetched (enrich_sources collects this into a list). Fetched
+        HTML/PDF bytes are dropped inside the worker; only the extracted
+        text is kept on the source.
+        
+        Args:
+            sources: List of source dicts (updated in place)
+        
+        Yields:
+            (source, success) tuples in input order
+        """
+        if not sources:
+            return
         
-        for i, source in enumerate(sources, 1):
-            url = source["url"]
-            is_pdf = source.get("is_pdf", False) or is_pdf_url(url)
+        # Fetches are I/O-bound: run them on a thread pool (shared session)
+        workers = max(1, min(self.enrich_workers, len(sources)))
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="enrich") as pool:
+            yield from pool.map(self._enrich_one, sources)
+    
+    def _enrich_one(self, source: Dict) -> tuple:
+        """
+        Fetch and extract the text of a single source (runs in a worker thread).
+        
+        Args:
+            source: Source dict (updated in place)
+        
+        Returns:
+            (source, success) where success is True if usable text was extracted
+        """
+        url = source["url"]
+        is_pdf = source.get("is_pdf", False) or is_pdf_url(url)
+        success = False
+        
+        # Recently enriched (e.g. re-run for the same company): skip fetch + parse
+        cache_key = f"enriched:{canonicalize_url(url)}"
+        cached = self.enrich_cache.get(cache_key, max_age=ENRICH_CACHE_TTL) if self.enrich_cache else None
+        if cached:
+            source.update(cached)
+            source["is_eu_source"] = is_eu_url(url)
+            return source, True
+        
+        try:
+            self._wait_for_host(url)
             
-            try:
-                # CASE 1: PDF Document
-                if is_pdf:
-                    print(f"   📄 Processing PDF: {url[:60]}...")
-                    text = extract_text_from_pdf_url(url, timeout=TIMEOUT)
-                    
-                    if text and len(text) >= 50:
-                        source["raw_text"] = text
-                        source["text_hash"] = hash_text(text)
-                        source["is_pdf"] = True
-                        source["is_earnings_report"] = is_earnings_report_pdf(text)
-                        source["has_ecommerce_keywords"] = self._has_ecommerce_keywords(text)
-                        success_count += 1
-                    else:
-                        source["raw_text"] = text or ""
-                        source["enrich_error"] = "PDF parsing failed or text too short"
-                        source["is_pdf"] = True
+            # CASE 1: PDF Document
+            if is_pdf:
+                logger.info(f"   📄 Processing PDF: {url[:60]}...")
+                text = extract_text_from_pdf_url(
+                    url,
+                    timeout=TIMEOUT,
+                    session=self.fetch_session,
+                    max_pages=PDF_MAX_PAGES,
+                    max_chars=PDF_MAX_CHARS
+                )
                 
-                # CASE 2: HTML Page
+                if text and len(text) >= 50:
+                    source["raw_text"] = text
+                    source["text_hash"] = hash_text(text)
+                    source["is_pdf"] = True
+                    has_ecom, is_earnings = self._scan_pdf_keywords(text)
+                    source["is_earnings_report"] = is_earnings
+                    source["has_ecommerce_keywords"] = has_ecom
+                    success = True
                 else:
-                    response = requests.get(
-                        url, 
-                        headers=HEADERS, 
-                        timeout=TIMEOUT,
-                        allow_redirects=True
-                    )
+                    source["raw_text"] = text or ""
+                    source["enrich_error"] = "PDF parsing failed or text too short"
+                    source["is_pdf"] = True
+            
+            # CASE 2: HTML Page
+            else:
+                with self.fetch_session.get(
+                    url,
+                    timeout=TIMEOUT,
+                    allow_redirects=True,
+                    stream=True
+                ) as response:
                     response.raise_for_status()
                     
                     # Store final URL after redirects
@@ -1003,62 +1561,142 @@ class CompanyIntelligenceScraper:
                     if final_url != url:
                         source["final_url"] = final_url
                     
-                    # Extract main content
-                    text = self._extract_article_text(response.text)
-                    
-                    if len(text) >= 50:
-                        source["raw_text"] = text
-                        source["text_hash"] = hash_text(text)
-                        source["has_ecommerce_keywords"] = self._has_ecommerce_keywords(text)
-                        success_count += 1
-                    else:
-                        source["raw_text"] = text
-                        source["enrich_error"] = f"Text too short ({len(text)} chars)"
-                    
-                    source["http_status_code"] = response.status_code
-                
-                source["is_eu_source"] = is_eu_url(url)
-                source["fetch_timestamp"] = datetime.now(timezone.utc).isoformat()
-                enriched.append(source)
+                    html = self._read_html(response)
                 
-                if i % 10 == 0:
-                    print(f"   {i}/{len(sources)} processed...")
+                # Extract main content
+                text, text_hash = self._extract_text_memoized(html)
                 
-                # Rate limiting
-                time.sleep(0.3)
+                if len(text) >= 50:
+                    source["raw_text"] = text
+                    source["text_hash"] = text_hash
+                    source["has_ecommerce_keywords"] = self._has_ecommerce_keywords(text)
+                    success = True
+                else:
+                    source["raw_text"] = text
+                    source["enrich_error"] = f"Text too short ({len(text)} chars)"
                 
-            except Exception as e:
-                source["raw_text"] = ""
-                source["enrich_error"] = str(e)[:200]
-                source["fetch_timestamp"] = datetime.now(timezone.utc).isoformat()
-                enriched.append(source)
-                print(f"   ✗ Error {url[:60]}: {str(e)[:50]}")
+                source["http_status_code"] = response.status_code
+            
+            source["is_eu_source"] = is_eu_url(url)
+            source["fetch_timestamp"] = datetime.now(timezone.utc).isoformat()
+            
+            if success and self.enrich_cache:
+                self.enrich_cache.set(cache_key, {
+                    field: source[field] for field in ENRICH_CACHE_FIELDS if field in source
+                })
         
-        print(f"✅ Enriched {success_count}/{len(sources)} sources successfully")
-        print(f"   Kept {len(enriched)} total sources (including failures)")
+        except Exception as e:
+            source["raw_text"] = ""
+            source["enrich_error"] = str(e)[:200]
+            source["fetch_timestamp"] = datetime.now(timezone.utc).isoformat()
+            logger.warning(f"   ✗ Error {url[:60]}: {str(e)[:50]}")
         
-        return enriched
+        return source, success
     
-    def _extract_article_text(self, html: str) -> str:
-        """Extract main article text from HTML."""
+    def _wait_for_host(self, url: str):
+        """
+        Per-host rate limit: keep HOST_MIN_INTERVAL between fetches to one host.
+        
+        Each caller reserves the host's next free slot under the lock and
+        sleeps outside it, so fetches to other hosts are never delayed.
+        
+        Args:
+            url: URL about to be fetched
+        """
+        host = extract_domain(url) or url
+        now = time.monotonic()
+        
+        with self._host_lock:
+            slot = max(now, self._host_next_slot.get(host, 0.0))
+            self._host_next_slot[host] = slot + HOST_MIN_INTERVAL
+        
+        if slot > now:
+            time.sleep(slot - now)
+    
+    @staticmethod
+    def _read_html(response):
+        """
+        Read a streamed HTML response, at most MAX_HTML_BYTES.
+        
+        Args:
+            response: requests Response opened with stream=True
+        
+        Returns:
+            str if the Content-Type header names a charset or the body is
+            valid UTF-8, else raw bytes (lxml/readability then use the
+            page's <meta charset>)
+        """
+        chunks = []
+        total = 0
+        for chunk in response.iter_content(HTML_CHUNK_SIZE):
+            chunks.append(chunk)
+            total += len(chunk)
+            if total >= MAX_HTML_BYTES:
+                break
+        body = b"".join(chunks)[:MAX_HTML_BYTES]
+        truncated = total >= MAX_HTML_BYTES
+        
+        if "charset" in response.headers.get("Content-Type", "").lower() and response.encoding:
+            try:
+                return body.decode(response.encoding, errors="replace")
+            except LookupError:
+                pass  # Unknown charset name
+        
+        # No declared charset: most pages are UTF-8 (lxml alone would assume Latin-1).
+        # The cut at MAX_HTML_BYTES may split a character; the incremental decoder
+        # (final=False) drops that partial tail but still rejects invalid bytes.
         try:
-            # Try readability first (FIXED import!)
-            from readability.readability import Document
-            doc = Document(html)
-            article_html = doc.summary(html_partial=True)
-            
-            soup = BeautifulSoup(article_html, "html.parser")
-            # Remove script/style
-            for tag in soup(["script", "style", "noscript"]):
-                tag.decompose()
-            
-            text = soup.get_text(separator=" ", strip=True)
-        except Exception:
+            if truncated:
+                return codecs.getincrementaldecoder("utf-8")().decode(body, final=False)
+            return body.decode("utf-8")
+        except UnicodeDecodeError:
+            return body
+    
+    def _extract_text_memoized(self, html) -> tuple:
+        """
+        Extract article text and its hash, reusing both for byte-identical pages.
+        
+        Syndicated articles often come back under several URLs (editions,
+        mirrors); readability + parsing + hashing run once per distinct
+        HTML body.
+        
+        Args:
+            html: Page HTML (str or bytes, see _read_html)
+        
+        Returns:
+            (text, text_hash)
+        """
+        raw = html.encode("utf-8") if isinstance(html, str) else html
+        fingerprint = hashlib.blake2b(raw, digest_size=16).digest()
+        
+        with self._extracted_lock:
+            cached = self._extracted_texts.get(fingerprint)
+        if cached is not None:
+            return cached
+        
+        text = self._extract_article_text(html)
+        result = (text, hash_text(text))
+        
+        with self._extracted_lock:
+            if len(self._extracted_texts) < EXTRACT_MEMO_SIZE:
+                self._extracted_texts[fingerprint] = result
+        return result
+    
+    def _extract_article_text(self, html) -> str:
+        """Extract main article text from HTML (str or bytes)."""
+        text = None
+        
+        # Try readability first
+        if Document is not None:
+            try:
+                article_html = Document(html).summary(html_partial=True)
+                text = _html_to_text(article_html)
+            except Exception:
+                text = None
+        
+        if text is None:
             # Fallback: simple extraction
-            soup = BeautifulSoup(html, "html.parser")
-            for tag in soup(["script", "style", "noscript"]):
-                tag.decompose()
-            text = soup.get_text(separator=" ", strip=True)
+            text = _html_to_text(html)
         
         # Clean whitespace
         text = clean_whitespace(text)
@@ -1070,14 +1708,14 @@ class CompanyIntelligenceScraper:
     # ==========================================================================
     
     def _deduplicate_sources(self, sources: List[Dict]) -> List[Dict]:
-        """Deduplicate sources by normalized URL."""
-        seen = set()
+        """Deduplicate sources by canonical URL fingerprint (first occurrence wins)."""
+        seen = set()  # 64-bit ints, not URL strings
         deduplicated = []
         
         for source in sources:
-            url_normalized = normalize_url(source["url"])
-            if url_normalized not in seen:
-                seen.add(url_normalized)
+            fingerprint = url_fingerprint(source["url"])
+            if fingerprint not in seen:
+                seen.add(fingerprint)
                 deduplicated.append(source)
         
         return deduplicated
@@ -1087,8 +1725,40 @@ class CompanyIntelligenceScraper:
         if not text:
             return False
         
-        text_lower = text.lower()
-        return any(keyword in text_lower for keyword in ECOMMERCE_KEYWORDS)
+        if _ECOMMERCE_AUTOMATON is not None:
+            # Stops at the first match; cost doesn't grow with the keyword count
+            return next(_ECOMMERCE_AUTOMATON.iter(text.lower()), None) is not None
+        
+        return ECOMMERCE_RE.search(text) is not None
+    
+    def _scan_pdf_keywords(self, text: str) -> tuple:
+        """
+        Check e-commerce and earnings keywords in one pass over the text.
+        
+        Args:
+            text: Extracted PDF text
+        
+        Returns:
+            (has_ecommerce_keywords, is_earnings_report)
+        """
+        if _CONTENT_AUTOMATON is None:
+            return self._has_ecommerce_keywords(text), is_earnings_report_pdf(text)
+        
+        # Same length gate as is_earnings_report_pdf
+        check_earnings = bool(text) and len(text) >= 200
+        has_ecom = False
+        earnings_found = set()
+        
+        for _, (kw, tags) in _CONTENT_AUTOMATON.iter(text.lower()):
+            if "ecommerce" in tags:
+                has_ecom = True
+            if check_earnings and "earnings" in tags:
+                earnings_found.add(kw)
+            # Stop once both answers are known
+            if has_ecom and (not check_earnings or len(earnings_found) >= EARNINGS_MIN_MATCHES):
+                break
+        
+        return has_ecom, len(earnings_found) >= EARNINGS_MIN_MATCHES
     
     def get_stats(self) -> Dict:
         """Get discovery statistics."""
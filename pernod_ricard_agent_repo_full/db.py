@@ -1,8 +1,13 @@
 # db.py - Database management with JSON fallback
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, text, table, column, insert
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.pool import NullPool
+from sqlalchemy.exc import DBAPIError
 import os
 import socket
+import time
+import threading
+from functools import lru_cache
 from urllib.parse import urlparse, parse_qsl, urlencode, urlunparse
 from typing import Optional
 import json
@@ -13,6 +18,19 @@ try:
 except Exception:
     st = None
 
+# optional: faster JSON serialization for jsonb columns
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _jdumps(value) -> str:
+    """Serialize a value for a jsonb parameter (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(value)
+
 # ==============================================================================
 # DATABASE URL CONFIGURATION
 # ==============================================================================
@@ -25,6 +43,35 @@ def _get_raw_url() -> Optional[str]:
     return url
 
 
+# Max seconds to wait for the IPv4 lookup of the DB host
+DNS_TIMEOUT = 3
+
+
+@lru_cache(maxsize=32)
+def _resolve_ipv4(host: str) -> Optional[str]:
+    """
+    Resolve host to its first IPv4 address (cached, bounded wait).
+    
+    getaddrinfo ignores socket timeouts, so the lookup runs in a daemon
+    thread and is abandoned after DNS_TIMEOUT; the module import (and with
+    it app startup) never hangs on a slow resolver.
+    """
+    result = {}
+    
+    def lookup():
+        try:
+            infos = socket.getaddrinfo(host, None, socket.AF_INET)
+            if infos:
+                result["ip"] = infos[0][4][0]
+        except Exception:
+            pass
+    
+    worker = threading.Thread(target=lookup, name="db-dns", daemon=True)
+    worker.start()
+    worker.join(DNS_TIMEOUT)
+    return result.get("ip")
+
+
 def _enforce_ssl_and_ipv4(url: str) -> str:
     """Enforce SSL and resolve IPv4 for better connection stability."""
     u = urlparse(url)
@@ -36,13 +83,9 @@ def _enforce_ssl_and_ipv4(url: str) -> str:
     # Try to resolve IPv4 for better stability
     host = u.hostname
     if host:
-        try:
-            infos = socket.getaddrinfo(host, None, socket.AF_INET)
-            if infos:
-                ipv4 = infos[0][4][0]
-                q["hostaddr"] = ipv4
-        except Exception:
-            pass
+        ipv4 = _resolve_ipv4(host)
+        if ipv4:
+            q["hostaddr"] = ipv4
     
     new_query = urlencode(q)
     scheme = "postgresql"
@@ -65,6 +108,27 @@ DATABASE_URL = None
 engine = None
 USE_DATABASE = False
 
+# Connection pooling: reuse warm connections across calls/reruns.
+# Set DB_USE_NULLPOOL=1 for short-lived (serverless) processes where
+# pooled connections would outlive the request.
+DB_USE_NULLPOOL = os.getenv("DB_USE_NULLPOOL", "").lower() in ("1", "true", "yes")
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_RECYCLE = 3600  # seconds; drop connections before server/proxy idle timeouts
+
+
+def _pool_options() -> dict:
+    """create_engine() pool arguments (NullPool or tuned QueuePool)."""
+    if DB_USE_NULLPOOL:
+        return {"poolclass": NullPool}
+    return {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": 30,
+        "pool_recycle": DB_POOL_RECYCLE,
+    }
+
+
 raw_url = _get_raw_url()
 if raw_url:
     try:
@@ -72,9 +136,10 @@ if raw_url:
         engine = create_engine(
             DATABASE_URL,
             pool_pre_ping=True,
-            poolclass=NullPool,  # Better for serverless
+            json_serializer=_jdumps,
             connect_args={"connect_timeout": 10},
             echo=False,
+            **_pool_options()
         )
         # Test connection
         with engine.connect() as conn:
@@ -91,6 +156,68 @@ else:
     USE_DATABASE = False
 
 
+# ==============================================================================
+# QUERY RESULT CACHE
+# ==============================================================================
+
+class _TTLCache:
+    """
+    Small thread-safe TTL cache for row lookups by id (oldest evicted first).
+    
+    Every pop() bumps an epoch; set() with the epoch read before the query
+    is ignored if an invalidation happened meanwhile, so a row read before a
+    concurrent write commits can't be cached after that write.
+    """
+    
+    def __init__(self, maxsize: int = 1024, ttl: float = 30):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = {}
+        self._epoch = 0
+        self._lock = threading.Lock()
+    
+    @property
+    def epoch(self) -> int:
+        """Invalidation counter (read before querying, pass to set())."""
+        return self._epoch
+    
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if time.monotonic() > expires_at:
+                del self._data[key]
+                return None
+        return dict(value)  # callers may mutate the returned row
+    
+    def set(self, key, value: dict, epoch: Optional[int] = None):
+        with self._lock:
+            if epoch is not None and epoch != self._epoch:
+                return  # invalidated while the row was being read
+            if key not in self._data and len(self._data) >= self.maxsize:
+                self._data.pop(next(iter(self._data)))  # dicts keep insertion order
+            self._data[key] = (time.monotonic() + self.ttl, dict(value))
+    
+    def pop(self, key):
+        with self._lock:
+            self._epoch += 1
+            self._data.pop(key, None)
+
+
+# get_company / get_analysis results (UI polling hits the same ids repeatedly);
+# analysis entries are dropped by every analysis write below
+_company_cache = _TTLCache()
+_analysis_cache = _TTLCache()  # keyed by (analysis_id, include_result)
+
+
+def _invalidate_analysis(analysis_id: str):
+    """Drop cached get_analysis() rows for an analysis."""
+    _analysis_cache.pop((analysis_id, False))
+    _analysis_cache.pop((analysis_id, True))
+
+
 # ==============================================================================
 # DATABASE INITIALIZATION
 # ==============================================================================
@@ -121,6 +248,20 @@ def init_db():
 # HELPER FUNCTIONS - COMPANIES
 # ==============================================================================
 
+# Postgres SQLSTATE for "no unique or exclusion constraint matching the ON CONFLICT specification"
+_NO_CONFLICT_TARGET = "42P10"
+
+# False once the upsert failed because idx_companies_name_lower is missing
+# (database created before it and init_db() not re-run)
+_company_upsert_supported = True
+
+
+def _sqlstate(error: DBAPIError) -> Optional[str]:
+    """SQLSTATE of a driver error (psycopg2: pgcode, psycopg 3: sqlstate)."""
+    orig = getattr(error, "orig", None)
+    return getattr(orig, "pgcode", None) or getattr(orig, "sqlstate", None)
+
+
 def get_or_create_company(name: str, domain: Optional[str] = None, 
                           newsroom_url: Optional[str] = None,
                           linkedin_url: Optional[str] = None,
@@ -129,10 +270,41 @@ def get_or_create_company(name: str, domain: Optional[str] = None,
     Get existing company or create new one.
     Returns company_id (uuid as string) or None if no database.
     """
+    global _company_upsert_supported
     if not USE_DATABASE or not engine:
         return None
     
+    params = {
+        "name": name,
+        "domain": domain,
+        "newsroom_url": newsroom_url,
+        "linkedin_url": linkedin_url,
+        "config": _jdumps(config or {})
+    }
+    
     try:
+        if _company_upsert_supported:
+            try:
+                with engine.begin() as conn:
+                    # Single round trip: the no-op update on conflict makes
+                    # RETURNING yield the existing row's id as well
+                    result = conn.execute(
+                        text("""
+                            INSERT INTO companies (name, domain, newsroom_url, linkedin_url, config)
+                            VALUES (:name, :domain, :newsroom_url, :linkedin_url, CAST(:config AS jsonb))
+                            ON CONFLICT ((LOWER(name))) DO UPDATE SET name = companies.name
+                            RETURNING id
+                        """),
+                        params
+                    ).fetchone()
+                    
+                    return str(result[0])
+            except DBAPIError as e:
+                if _sqlstate(e) != _NO_CONFLICT_TARGET:
+                    raise
+                print("⚠️ idx_companies_name_lower missing (run init_db()), using SELECT + INSERT")
+                _company_upsert_supported = False
+        
         with engine.begin() as conn:
             # Check if exists
             result = conn.execute(
@@ -148,20 +320,13 @@ def get_or_create_company(name: str, domain: Optional[str] = None,
                 return str(result[0])
             
             # Create new
-            config_json = json.dumps(config or {})
             result = conn.execute(
                 text("""
                     INSERT INTO companies (name, domain, newsroom_url, linkedin_url, config)
-                    VALUES (:name, :domain, :newsroom_url, :linkedin_url, :config::jsonb)
+                    VALUES (:name, :domain, :newsroom_url, :linkedin_url, CAST(:config AS jsonb))
                     RETURNING id
                 """),
-                {
-                    "name": name,
-                    "domain": domain,
-                    "newsroom_url": newsroom_url,
-                    "linkedin_url": linkedin_url,
-                    "config": config_json
-                }
+                params
             ).fetchone()
             
             return str(result[0])
@@ -171,28 +336,30 @@ def get_or_create_company(name: str, domain: Optional[str] = None,
 
 
 def get_company(company_id: str) -> Optional[dict]:
-    """Get company by ID."""
+    """Get company by ID (cached for a few seconds)."""
     if not USE_DATABASE or not engine:
         return None
     
+    cached = _company_cache.get(company_id)
+    if cached is not None:
+        return cached
+    
     try:
         with engine.connect() as conn:
             result = conn.execute(
-                text("SELECT * FROM companies WHERE id = :id"),
+                text("""
+                    SELECT id, name, domain, newsroom_url, linkedin_url,
+                           config, created_at, updated_at
+                    FROM companies WHERE id = :id
+                """),
                 {"id": company_id}
             ).fetchone()
             
             if result:
-                return {
-                    "id": str(result[0]),
-                    "name": result[1],
-                    "domain": result[2],
-                    "newsroom_url": result[3],
-                    "linkedin_url": result[4],
-                    "config": result[5],
-                    "created_at": result[6],
-                    "updated_at": result[7]
-                }
+                company = dict(result._mapping)
+                company["id"] = str(company["id"])
+                _company_cache.set(company_id, company)
+                return company
     except Exception as e:
         print(f"❌ get_company failed: {e}")
     
@@ -203,6 +370,31 @@ def get_company(company_id: str) -> Optional[dict]:
 # HELPER FUNCTIONS - ANALYSES
 # ==============================================================================
 
+# Hot-path statements, built once: the engine's compiled cache then hits on
+# the same object instead of re-creating and re-keying a text() per call
+_UPDATE_PROGRESS = text("""
+    UPDATE analyses 
+    SET progress = CAST(:progress AS jsonb)
+    WHERE id = :id
+""")
+
+_COMPLETE_ANALYSIS = text("""
+    UPDATE analyses 
+    SET status = 'completed',
+        completed_at = :now,
+        result_json = CAST(:result AS jsonb),
+        validation_stats = CAST(:stats AS jsonb)
+    WHERE id = :id
+""")
+
+_FAIL_ANALYSIS = text("""
+    UPDATE analyses 
+    SET status = 'failed',
+        completed_at = :now,
+        error_message = :error
+    WHERE id = :id
+""")
+
 def create_analysis(company_id: str, lookback_days: int = 14, 
                     max_sources: int = 50) -> Optional[str]:
     """
@@ -242,18 +434,17 @@ def update_analysis_progress(analysis_id: str, progress: dict):
     try:
         with engine.begin() as conn:
             conn.execute(
-                text("""
-                    UPDATE analyses 
-                    SET progress = :progress::jsonb
-                    WHERE id = :id
-                """),
+                _UPDATE_PROGRESS,
                 {
                     "id": analysis_id,
-                    "progress": json.dumps(progress)
+                    "progress": _jdumps(progress)
                 }
             )
     except Exception as e:
         print(f"❌ update_analysis_progress failed: {e}")
+    finally:
+        # After commit: a poll between invalidation and commit would re-cache the old row
+        _invalidate_analysis(analysis_id)
 
 
 def complete_analysis(analysis_id: str, result_json: dict, 
@@ -265,23 +456,18 @@ def complete_analysis(analysis_id: str, result_json: dict,
     try:
         with engine.begin() as conn:
             conn.execute(
-                text("""
-                    UPDATE analyses 
-                    SET status = 'completed',
-                        completed_at = :now,
-                        result_json = :result::jsonb,
-                        validation_stats = :stats::jsonb
-                    WHERE id = :id
-                """),
+                _COMPLETE_ANALYSIS,
                 {
                     "id": analysis_id,
                     "now": datetime.now(timezone.utc),
-                    "result": json.dumps(result_json),
-                    "stats": json.dumps(validation_stats)
+                    "result": _jdumps(result_json),
+                    "stats": _jdumps(validation_stats)
                 }
             )
     except Exception as e:
         print(f"❌ complete_analysis failed: {e}")
+    finally:
+        _invalidate_analysis(analysis_id)
 
 
 def fail_analysis(analysis_id: str, error_message: str):
@@ -292,13 +478,7 @@ def fail_analysis(analysis_id: str, error_message: str):
     try:
         with engine.begin() as conn:
             conn.execute(
-                text("""
-                    UPDATE analyses 
-                    SET status = 'failed',
-                        completed_at = :now,
-                        error_message = :error
-                    WHERE id = :id
-                """),
+                _FAIL_ANALYSIS,
                 {
                     "id": analysis_id,
                     "now": datetime.now(timezone.utc),
@@ -307,35 +487,56 @@ def fail_analysis(analysis_id: str, error_message: str):
             )
     except Exception as e:
         print(f"❌ fail_analysis failed: {e}")
+    finally:
+        _invalidate_analysis(analysis_id)
+
+
+# get_analysis() columns; the large jsonb payloads are only read on request
+ANALYSIS_COLUMNS = (
+    "id, company_id, status, progress, lookback_days, max_sources, "
+    "started_at, completed_at, error_message, created_at"
+)
+ANALYSIS_RESULT_COLUMNS = "result_json, validation_stats"
+
+_SELECT_ANALYSIS = {
+    False: text(f"SELECT {ANALYSIS_COLUMNS} FROM analyses WHERE id = :id"),
+    True: text(f"SELECT {ANALYSIS_COLUMNS}, {ANALYSIS_RESULT_COLUMNS} FROM analyses WHERE id = :id"),
+}
 
 
-def get_analysis(analysis_id: str) -> Optional[dict]:
-    """Get analysis by ID."""
+def get_analysis(analysis_id: str, *, include_result: bool = False) -> Optional[dict]:
+    """
+    Get analysis by ID (cached until the next write to it).
+    
+    Args:
+        analysis_id: Analysis uuid
+        include_result: Also load result_json and validation_stats
+    
+    Returns:
+        Analysis dict or None
+    """
     if not USE_DATABASE or not engine:
         return None
     
+    cache_key = (analysis_id, include_result)
+    cached = _analysis_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    epoch = _analysis_cache.epoch
+    
     try:
         with engine.connect() as conn:
             result = conn.execute(
-                text("SELECT * FROM analyses WHERE id = :id"),
+                _SELECT_ANALYSIS[include_result],
                 {"id": analysis_id}
             ).fetchone()
             
             if result:
-                return {
-                    "id": str(result[0]),
-                    "company_id": str(result[1]) if result[1] else None,
-                    "status": result[2],
-                    "progress": result[3],
-                    "lookback_days": result[4],
-                    "max_sources": result[5],
-                    "started_at": result[6],
-                    "completed_at": result[7],
-                    "error_message": result[8],
-                    "result_json": result[9],
-                    "validation_stats": result[10],
-                    "created_at": result[11]
-                }
+                analysis = dict(result._mapping)
+                analysis["id"] = str(analysis["id"])
+                analysis["company_id"] = str(analysis["company_id"]) if analysis["company_id"] else None
+                _analysis_cache.set(cache_key, analysis, epoch=epoch)
+                return analysis
     except Exception as e:
         print(f"❌ get_analysis failed: {e}")
     
@@ -358,7 +559,7 @@ def get_latest_analyses(limit: int = 10) -> list:
                         a.status,
                         a.created_at,
                         a.completed_at,
-                        (SELECT COUNT(*) FROM signals WHERE analysis_id = a.id) as signal_count
+                        a.signal_count
                     FROM analyses a
                     JOIN companies c ON c.id = a.company_id
                     ORDER BY a.created_at DESC
@@ -384,6 +585,77 @@ def get_latest_analyses(limit: int = 10) -> list:
         return []
 
 
+# ==============================================================================
+# HELPER FUNCTIONS - SIGNALS
+# ==============================================================================
+
+# Lightweight Core table for bulk inserts (schema lives in models.sql)
+_signals_table = table(
+    "signals",
+    column("analysis_id"),
+    column("source_id"),
+    column("type"),
+    column("value", JSONB),
+    column("verbatim_quote"),
+    column("source_title"),
+    column("source_url"),
+    column("confidence"),
+    column("fact_check_status"),
+    column("corroboration_count"),
+    column("corroborating_sources", JSONB),
+    column("validation_status"),
+    column("rejection_reason"),
+)
+
+
+def _signal_row(analysis_id: str, signal: dict) -> dict:
+    """Map a validated signal dict to a signals table row."""
+    return {
+        "analysis_id": analysis_id,
+        "source_id": signal.get("source_id"),
+        "type": signal.get("type"),
+        "value": signal.get("value") or {},
+        "verbatim_quote": signal.get("verbatim_quote", ""),
+        "source_title": signal.get("source_title"),
+        "source_url": signal.get("source_url"),
+        "confidence": signal.get("confidence"),
+        "fact_check_status": signal.get("fact_check_status"),
+        "corroboration_count": signal.get("corroboration_count", 0),
+        "corroborating_sources": signal.get("corroborating_sources") or [],
+        "validation_status": signal.get("validation_status", "pending"),
+        "rejection_reason": signal.get("rejection_reason"),
+    }
+
+
+def insert_signals_bulk(analysis_id: str, signals: list) -> int:
+    """
+    Insert all signals of an analysis in one transaction.
+    
+    Rows go out as a single executemany; SQLAlchemy batches them into
+    multi-row INSERT ... VALUES statements (insertmanyvalues), so the
+    cost is a few round-trips instead of one transaction per signal.
+    
+    Args:
+        analysis_id: Analysis UUID
+        signals: List of signal dicts
+    
+    Returns:
+        Number of inserted rows (0 if no database or on error)
+    """
+    if not USE_DATABASE or not engine or not signals:
+        return 0
+    
+    rows = [_signal_row(analysis_id, signal) for signal in signals]
+    
+    try:
+        with engine.begin() as conn:
+            conn.execute(insert(_signals_table), rows)
+        return len(rows)
+    except Exception as e:
+        print(f"❌ insert_signals_bulk failed: {e}")
+        return 0
+
+
 # ==============================================================================
 # MAIN (for testing)
 # ==============================================================================
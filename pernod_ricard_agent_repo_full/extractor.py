@@ -8,6 +8,9 @@ Supports any company (not just Pernod Ricard).
 import os
 import json
 import re
+import threading
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List
 from pathlib import Path
 
@@ -27,10 +30,73 @@ try:
 except ImportError:
     OpenAI = None
 
+# optional: faster JSON parsing of model responses
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Pydantic models
 from models.signal_models import Signal, SignalValue
 
 
+# Concurrent LLM requests in extract_from_sources (calls are I/O bound)
+EXTRACT_WORKERS = 8
+
+# Client-side retries (exponential backoff) on rate limits, 5xx and timeouts
+API_MAX_RETRIES = 3
+
+# Max article characters sent to the LLM
+ARTICLE_CHAR_LIMIT = 8000
+
+# Articles per LLM request in extract_from_sources (1 = one request per article)
+EXTRACT_BATCH_SIZE = 4
+
+# Max article characters per batched request (~10k tokens, leaves room for prompt + output)
+BATCH_MAX_CHARS = 40_000
+
+PROMPTS_DIR = Path(__file__).parent / "prompts"
+
+SYSTEM_MESSAGE = "You are a rigorous fact extractor. Only extract explicitly stated facts with exact quotes."
+
+# Prompt headings delimiting the per-article sections. Everything outside them
+# (rules before, response format after) goes verbatim into the system message,
+# so the request prefix is identical for every article of a run. Note that the
+# current prompts' instructions (~3.4-3.9k characters) are probably below the
+# 1024-token minimum for OpenAI's automatic prompt caching.
+ARTICLE_SECTION_MARKER = "**ARTICLE"
+RESPONSE_SECTION_MARKER = "**YOUR RESPONSE:**"
+
+
+@lru_cache(maxsize=8)
+def _load_prompt(filename: str) -> tuple:
+    """
+    Read a prompt template from prompts/ (cached per filename).
+    
+    Args:
+        filename: Prompt filename in prompts/ directory
+    
+    Returns:
+        (instructions, article_part) templates; instructions is "" if the
+        template has no article section heading
+    """
+    prompt_path = PROMPTS_DIR / filename
+    if not prompt_path.exists():
+        raise FileNotFoundError(f"Prompt file not found: {prompt_path}")
+    
+    template = prompt_path.read_text(encoding='utf-8')
+    start = template.find(ARTICLE_SECTION_MARKER)
+    if start <= 0:
+        return "", template
+    
+    end = template.find(RESPONSE_SECTION_MARKER, start)
+    if end < 0:
+        return template[:start].rstrip(), template[start:]
+    
+    instructions = template[:start] + template[end:]
+    return instructions.strip(), template[start:end].strip()
+
+
 class SignalExtractor:
     """
     Extracts signals from article text using LLM.
@@ -46,7 +112,10 @@ class SignalExtractor:
         self,
         api_key: Optional[str] = None,
         model: str = "gpt-4o-mini",
-        prompt_file: str = "extract_signals_v2.txt"
+        prompt_file: str = "extract_signals_v2.txt",
+        batch_prompt_file: str = "extract_signals_batch.txt",
+        max_workers: int = EXTRACT_WORKERS,
+        batch_size: int = EXTRACT_BATCH_SIZE
     ):
         """
         Initialize extractor.
@@ -55,6 +124,9 @@ class SignalExtractor:
             api_key: OpenAI API key (or from env/secrets)
             model: Model to use
             prompt_file: Prompt filename in prompts/ directory
+            batch_prompt_file: Multi-article prompt filename in prompts/ directory
+            max_workers: Concurrent LLM requests when extracting from sources
+            batch_size: Articles per LLM request when extracting from sources
         """
         # Get API key
         if not api_key:
@@ -70,15 +142,14 @@ class SignalExtractor:
         if not OpenAI:
             raise RuntimeError("openai package not installed. Run: pip install openai")
         
-        self.client = OpenAI(api_key=api_key)
+        self.client = OpenAI(api_key=api_key, max_retries=API_MAX_RETRIES)
         self.model = model
+        self.max_workers = max(1, max_workers)
+        self.batch_size = max(1, batch_size)
         
-        # Load prompt template
-        prompt_path = Path(__file__).parent / "prompts" / prompt_file
-        if not prompt_path.exists():
-            raise FileNotFoundError(f"Prompt file not found: {prompt_path}")
-        
-        self.prompt_template = prompt_path.read_text(encoding='utf-8')
+        # Load prompt templates
+        self.prompt_template = _load_prompt(prompt_file)
+        self.batch_prompt_template = _load_prompt(batch_prompt_file)
         
         # Stats
         self.stats = {
@@ -88,6 +159,76 @@ class SignalExtractor:
             'api_errors': 0
         }
         self.error_log = []  # Track actual error messages
+        self._stats_lock = threading.Lock()  # articles are extracted concurrently
+    
+    def _bump(self, key: str, n: int = 1):
+        """Increment a stats counter (thread-safe)."""
+        with self._stats_lock:
+            self.stats[key] += n
+    
+    def _log_api_error(self, e: Exception):
+        """Count and record a failed LLM request."""
+        self._bump('api_errors')
+        # Log the actual error for debugging
+        error_msg = f"API Error: {type(e).__name__}: {str(e)}"
+        with self._stats_lock:
+            self.error_log.append(error_msg)
+        print(f"❌ {error_msg}")  # Print to console for debugging
+    
+    def _complete(self, template: tuple, max_tokens: int = 2000, **fields) -> dict:
+        """
+        Send one extraction prompt and parse the JSON response.
+        
+        Args:
+            template: (instructions, article_part) from _load_prompt
+            max_tokens: Completion token limit
+            **fields: Template placeholders (company_name, article_text, ...)
+        
+        Returns:
+            Parsed JSON response
+        """
+        instructions, article_part = template
+        system_content = SYSTEM_MESSAGE
+        if instructions:
+            system_content += "\n\n" + instructions.format(**fields)
+        
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {
+                    "role": "system",
+                    "content": system_content
+                },
+                {
+                    "role": "user",
+                    "content": article_part.format(**fields)
+                }
+            ],
+            response_format={"type": "json_object"},
+            temperature=0.0,
+            max_tokens=max_tokens
+        )
+        
+        content = response.choices[0].message.content
+        return orjson.loads(content) if orjson is not None else json.loads(content)
+    
+    def _validate_signals(self, signals_raw: list) -> List[Signal]:
+        """Validate raw signal dicts with Pydantic, skipping invalid ones."""
+        validated_signals = []
+        
+        for signal_data in signals_raw:
+            try:
+                # Pydantic validation (strict schema)
+                signal = Signal(**signal_data)
+                validated_signals.append(signal)
+                self._bump('signals_extracted')
+            
+            except Exception as e:
+                # Validation failed - skip this signal
+                self._bump('validation_failures')
+                continue
+        
+        return validated_signals
     
     def extract_from_article(
         self,
@@ -108,72 +249,98 @@ class SignalExtractor:
         Returns:
             List of validated Signal objects
         """
-        self.stats['articles_processed'] += 1
-        
-        # Build prompt
-        prompt = self.prompt_template.format(
-            company_name=company_name,
-            article_text=article_text[:8000],  # Limit context
-            article_title=article_title,
-            article_url=article_url
-        )
+        self._bump('articles_processed')
         
         try:
-            # Call LLM
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a rigorous fact extractor. Only extract explicitly stated facts with exact quotes."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.0,
-                max_tokens=2000
+            data = self._complete(
+                self.prompt_template,
+                company_name=company_name,
+                article_text=article_text[:ARTICLE_CHAR_LIMIT],  # Limit context
+                article_title=article_title,
+                article_url=article_url
             )
-            
-            # Parse response
-            content = response.choices[0].message.content
-            data = json.loads(content)
-            
-            # Extract signals array
-            signals_raw = data.get('signals', [])
-            if not signals_raw:
-                return []
-            
-            # Validate each signal with Pydantic
-            validated_signals = []
-            
-            for signal_data in signals_raw:
-                try:
-                    # Pydantic validation (strict schema)
-                    signal = Signal(**signal_data)
-                    validated_signals.append(signal)
-                    self.stats['signals_extracted'] += 1
-                    
-                except Exception as e:
-                    # Validation failed - skip this signal
-                    self.stats['validation_failures'] += 1
-                    continue
-            
-            return validated_signals
+            return self._validate_signals(data.get('signals') or [])
         
         except Exception as e:
-            self.stats['api_errors'] += 1
-            # Log the actual error for debugging
-            error_msg = f"API Error: {type(e).__name__}: {str(e)}"
-            if not hasattr(self, 'error_log'):
-                self.error_log = []
-            self.error_log.append(error_msg)
-            print(f"❌ {error_msg}")  # Print to console for debugging
+            self._log_api_error(e)
             # Return empty list on error (graceful degradation)
             return []
     
+    def extract_from_batch(
+        self,
+        articles: List[tuple],
+        company_name: str
+    ) -> List[List[Signal]]:
+        """
+        Extract signals from several articles with one LLM request.
+        
+        Falls back to one request per article if the model returns a
+        malformed batch response or the batch exceeds the context window.
+        
+        Args:
+            articles: List of (text, title, url) tuples
+            company_name: Company being analyzed
+        
+        Returns:
+            One list of validated Signal objects per article, in input order
+        """
+        items = [
+            {"id": i, "title": title, "url": url, "text": text[:ARTICLE_CHAR_LIMIT]}
+            for i, (text, title, url) in enumerate(articles)
+        ]
+        try:
+            data = self._complete(
+                self.batch_prompt_template,
+                max_tokens=2000 * len(articles),
+                company_name=company_name,
+                articles_json=json.dumps(items, ensure_ascii=False, indent=1)
+            )
+            entries = data.get('signals_by_article')
+            if not isinstance(entries, list):
+                raise ValueError("response has no 'signals_by_article' array")
+        
+        except Exception as e:
+            if isinstance(e, ValueError) or getattr(e, 'code', None) == 'context_length_exceeded':
+                # Malformed JSON / too large: retry articles individually
+                return [
+                    self.extract_from_article(text, title, url, company_name)
+                    for text, title, url in articles
+                ]
+            self._bump('articles_processed', len(articles))
+            self._log_api_error(e)
+            return [[] for _ in articles]
+        
+        self._bump('articles_processed', len(articles))
+        
+        # Route signals back to their article by id
+        results = [[] for _ in articles]
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            article_id = entry.get('id')
+            if isinstance(article_id, int) and 0 <= article_id < len(articles):
+                results[article_id].extend(self._validate_signals(entry.get('signals') or []))
+        
+        return results
+    
+    def _make_batches(self, articles: List[tuple]) -> List[List[tuple]]:
+        """Group (text, title, url) tuples into batches by count and size."""
+        batches = []
+        current, current_chars = [], 0
+        
+        for article in articles:
+            chars = min(len(article[0]), ARTICLE_CHAR_LIMIT)
+            if current and (len(current) >= self.batch_size or current_chars + chars > BATCH_MAX_CHARS):
+                batches.append(current)
+                current, current_chars = [], 0
+            current.append(article)
+            current_chars += chars
+        
+        if current:
+            batches.append(current)
+        
+        return batches
+    
     def extract_from_sources(
         self,
         sources: List[dict],
@@ -182,6 +349,10 @@ class SignalExtractor:
         """
         Extract signals from multiple sources.
         
+        Articles are grouped into batches of batch_size per LLM request and
+        batches are sent concurrently (max_workers at a time); signals are
+        returned in source order.
+        
         Args:
             sources: List of source dicts with 'text', 'title', 'url'
             company_name: Company being analyzed
@@ -189,29 +360,34 @@ class SignalExtractor:
         Returns:
             List of signal dicts (serialized Pydantic models)
         """
-        all_signals = []
+        articles = []
         
         for source in sources:
             text = source.get('text') or source.get('raw_text', '')
-            title = source.get('title', '')
-            url = source.get('url', '')
             
             # Match scraper's threshold (was 100, now 50)
             if not text or len(text) < 50:
                 continue
             
-            # Extract signals
-            signals = self.extract_from_article(
-                article_text=text,
-                article_title=title,
-                article_url=url,
-                company_name=company_name
-            )
-            
-            # Convert to dicts for further processing
-            for signal in signals:
-                signal_dict = signal.model_dump()
-                all_signals.append(signal_dict)
+            articles.append((text, source.get('title', ''), source.get('url', '')))
+        
+        if not articles:
+            return []
+        
+        def extract(batch):
+            if len(batch) == 1:
+                text, title, url = batch[0]
+                return [self.extract_from_article(text, title, url, company_name)]
+            return self.extract_from_batch(batch, company_name)
+        
+        batches = self._make_batches(articles)
+        all_signals = []
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(batches))) as pool:
+            for batch_signals in pool.map(extract, batches):
+                for signals in batch_signals:
+                    # Convert to dicts for further processing
+                    all_signals.extend(signal.model_dump() for signal in signals)
         
         return all_signals
     
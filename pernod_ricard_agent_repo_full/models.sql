@@ -21,6 +21,32 @@ CREATE TABLE IF NOT EXISTS companies (
 );
 
 CREATE INDEX IF NOT EXISTS idx_companies_name ON companies(name);
+-- Before the first creation of idx_companies_name_lower: merge companies whose
+-- names differ only by case (oldest row wins, its analyses are kept)
+DO $$
+BEGIN
+  IF NOT EXISTS (SELECT 1 FROM pg_indexes WHERE indexname = 'idx_companies_name_lower') THEN
+    IF to_regclass('analyses') IS NOT NULL THEN  -- not yet created on a fresh database
+      UPDATE analyses a SET company_id = m.keep_id
+      FROM (
+        SELECT id, first_value(id) OVER (PARTITION BY LOWER(name) ORDER BY created_at, id) AS keep_id
+        FROM companies
+      ) m
+      WHERE a.company_id = m.id AND m.id <> m.keep_id;
+    END IF;
+    
+    DELETE FROM companies c
+    USING (
+      SELECT id, first_value(id) OVER (PARTITION BY LOWER(name) ORDER BY created_at, id) AS keep_id
+      FROM companies
+    ) m
+    WHERE c.id = m.id AND m.id <> m.keep_id;
+  END IF;
+END;
+$$;
+
+-- Case-insensitive uniqueness (ON CONFLICT target for get_or_create_company)
+CREATE UNIQUE INDEX IF NOT EXISTS idx_companies_name_lower ON companies(LOWER(name));
 CREATE INDEX IF NOT EXISTS idx_companies_created ON companies(created_at DESC);
 
 -- ==============================================================================
@@ -38,9 +64,25 @@ CREATE TABLE IF NOT EXISTS analyses (
   error_message text,
   result_json jsonb,
   validation_stats jsonb,
-  created_at timestamptz DEFAULT now()
+  created_at timestamptz DEFAULT now(),
+  signal_count int NOT NULL DEFAULT 0  -- maintained by the signals_count_* triggers
 );
 
+-- Existing databases: add the counter column and backfill it once
+DO $$
+BEGIN
+  IF NOT EXISTS (
+    SELECT 1 FROM information_schema.columns
+    WHERE table_name = 'analyses' AND column_name = 'signal_count'
+  ) THEN
+    ALTER TABLE analyses ADD COLUMN signal_count int NOT NULL DEFAULT 0;
+    UPDATE analyses a SET signal_count = s.cnt
+    FROM (SELECT analysis_id, COUNT(*) AS cnt FROM signals GROUP BY analysis_id) s
+    WHERE a.id = s.analysis_id;
+  END IF;
+END;
+$$;
+
 CREATE INDEX IF NOT EXISTS idx_analyses_company ON analyses(company_id, created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_analyses_status ON analyses(status);
 CREATE INDEX IF NOT EXISTS idx_analyses_created ON analyses(created_at DESC);
@@ -162,12 +204,49 @@ CREATE TRIGGER companies_updated_at
   FOR EACH ROW
   EXECUTE FUNCTION update_updated_at();
 
+-- Keep analyses.signal_count in sync (statement-level: one UPDATE per
+-- analysis per INSERT/DELETE statement, also for bulk inserts)
+CREATE OR REPLACE FUNCTION signals_count_insert()
+RETURNS TRIGGER AS $$
+BEGIN
+  UPDATE analyses a SET signal_count = a.signal_count + n.cnt
+  FROM (SELECT analysis_id, COUNT(*) AS cnt FROM new_rows GROUP BY analysis_id) n
+  WHERE a.id = n.analysis_id;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION signals_count_delete()
+RETURNS TRIGGER AS $$
+BEGIN
+  UPDATE analyses a SET signal_count = a.signal_count - o.cnt
+  FROM (SELECT analysis_id, COUNT(*) AS cnt FROM old_rows GROUP BY analysis_id) o
+  WHERE a.id = o.analysis_id;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS signals_count_insert ON signals;
+CREATE TRIGGER signals_count_insert
+  AFTER INSERT ON signals
+  REFERENCING NEW TABLE AS new_rows
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION signals_count_insert();
+
+DROP TRIGGER IF EXISTS signals_count_delete ON signals;
+CREATE TRIGGER signals_count_delete
+  AFTER DELETE ON signals
+  REFERENCING OLD TABLE AS old_rows
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION signals_count_delete();
+
 -- ==============================================================================
 -- VIEWS FOR CONVENIENCE
 -- ==============================================================================
 
--- Latest analyses per company
-CREATE OR REPLACE VIEW latest_analyses AS
+-- Latest analyses per company (dropped first: a.* changes when analyses gains columns)
+DROP VIEW IF EXISTS latest_analyses;
+CREATE VIEW latest_analyses AS
 SELECT DISTINCT ON (company_id)
   a.*,
   c.name as company_name,
@@ -10,13 +10,29 @@ import json
 import html
 import math
 import urllib.parse as ul
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 import feedparser
 from dateutil import parser as dateparser
 
+# optional: lxml für schnelles RSS-Parsing (Fallback: feedparser)
+try:
+    from lxml import etree
+    _RSS_PARSER = etree.XMLParser(resolve_entities=False, no_network=True)
+except ImportError:
+    etree = None
+
+# optional: schneller JSON-Codec (Fallback: stdlib json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # optional .env (lokal)
 try:
     from dotenv import load_dotenv
@@ -80,6 +96,13 @@ MIN_TEXT_CHARS_LINKEDIN = int(os.getenv("MIN_TEXT_CHARS_LINKEDIN", "140"))
 # HTTP
 HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; EU-DE-Ecom-Agent/1.0)"}
 TIMEOUT = 30
+GNEWS_WORKERS = int(os.getenv("GNEWS_WORKERS", "16"))  # parallele RSS-Abrufe
+
+# Gemeinsame Session (Keep-Alive, Connection-Pool für parallele Abrufe)
+_SESSION = requests.Session()
+_SESSION.headers.update(HEADERS)
+_SESSION.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=32))
+_SESSION.mount("http://", HTTPAdapter(pool_connections=32, pool_maxsize=32))
 
 # OpenAI
 OPENAI_API_KEY = (os.getenv("OPENAI_API_KEY") or "").strip()
@@ -100,6 +123,8 @@ ECOM_KEYWORDS = [
     "prime","seller","vendor","shop","webshop","checkout","basket","conversion","acquisition",
     "gmv","cart","buy box","fulfillment","fba","retouren","click & collect"
 ]
+# Einmal kompiliert: ein Regex-Durchlauf statt N Substring-Scans pro Text
+_ECOM_RE = re.compile("|".join(map(re.escape, ECOM_KEYWORDS)), re.IGNORECASE)
 
 # ---------- LLM-Kompatibilitäts-Helpers (Responses-API + Fallback) ----------
 def _extract_responses_text(resp):
@@ -147,7 +172,7 @@ def llm_json(system_msg: str, user_msg: str) -> dict:
 
         r = client.responses.create(**kwargs)
         txt = _extract_responses_text(r)
-        return json.loads(txt)
+        return parse_llm_json(txt)
     except Exception as e_responses:
         # 2) Fallback: Chat Completions (für gpt-4o-mini etc.)
         try:
@@ -161,7 +186,7 @@ def llm_json(system_msg: str, user_msg: str) -> dict:
                 ],
             )
             content = r.choices[0].message.content
-            return json.loads(content)
+            return parse_llm_json(content)
         except Exception as e_chat:
             raise RuntimeError(f"LLM JSON fehlgeschlagen (responses: {e_responses}; chat: {e_chat})")
 
@@ -201,19 +226,148 @@ def llm_text(system_msg: str, user_msg: str) -> str:
             raise RuntimeError(f"LLM TEXT fehlgeschlagen (responses: {e_responses}; chat: {e_chat})")
 
 # ================================ Utils ======================================
+def json_loads(data):
+    """JSON (str/bytes) parsen – orjson wenn verfügbar."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _first_json_object(text: str):
+    """Erstes vollständiges {...}-Objekt – ein Vorwärtsdurchlauf, Strings/Escapes werden beachtet."""
+    start = text.find("{")
+    if start < 0:
+        return None
+    depth, in_str, esc = 0, False, False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_str:
+            if esc:
+                esc = False
+            elif ch == "\\":
+                esc = True
+            elif ch == '"':
+                in_str = False
+        elif ch == '"':
+            in_str = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
+
+def parse_llm_json(text: str):
+    """LLM-Antwort als JSON parsen: direkt, sonst ohne ```json-Fences, sonst erstes {...}-Objekt."""
+    if not text:
+        raise ValueError("leere LLM-Antwort")
+    try:
+        return json_loads(text)
+    except ValueError:  # orjson.JSONDecodeError ist ein ValueError
+        pass
+    body = text.strip()
+    if body.startswith("```"):
+        nl = body.find("\n")
+        body = body[nl + 1:] if nl >= 0 else ""
+        body = body.rstrip()
+        if body.endswith("```"):
+            body = body[:-3]
+        try:
+            return json_loads(body)
+        except ValueError:
+            pass
+    obj = _first_json_object(body)
+    if obj is None:
+        raise ValueError("kein JSON-Objekt in LLM-Antwort")
+    return json_loads(obj)
+
+def write_json(path: str, obj) -> None:
+    """JSON mit 2er-Einrückung als UTF-8 schreiben – orjson wenn verfügbar."""
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(obj, f, ensure_ascii=False, indent=2)
+
 def now_utc() -> datetime:
     return datetime.now(timezone.utc)
 
+def parse_dt(val):
+    """
+    Datum parsen: ISO-8601 (eigene Ausgabe, meta-Tags) per fromisoformat,
+    alles andere (RFC-822 aus Feeds, Freitext) über dateutil.
+    Naive Zeiten gelten als UTC; nicht parsebar → None.
+    """
+    if not val:
+        return None
+    if isinstance(val, datetime):
+        dt = val
+    else:
+        s = str(val).strip()
+        try:
+            dt = datetime.fromisoformat(s[:-1] + "+00:00" if s.endswith("Z") else s)
+        except ValueError:
+            try:
+                dt = dateparser.parse(s)
+            except (ValueError, OverflowError):
+                return None
+    if dt and dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
 def is_recent(dt: datetime, hours: int) -> bool:
     if not isinstance(dt, datetime):
         return False
     return (now_utc() - dt) <= timedelta(hours=hours)
 
 def fetch(url: str) -> str:
-    r = requests.get(url, headers=HEADERS, timeout=TIMEOUT)
+    r = _SESSION.get(url, timeout=TIMEOUT)
     r.raise_for_status()
     return r.text
 
+def parse_rss_entries(content: bytes) -> list:
+    """
+    RSS 2.0 (<item> mit title/link/pubDate) direkt per lxml lesen.
+    Liefert Dicts mit den Keys, die _entry_to_item erwartet; bei kaputtem XML
+    oder anderem Format (z. B. Atom) übernimmt feedparser.
+    """
+    if etree is not None:
+        try:
+            root = etree.fromstring(content, parser=_RSS_PARSER)
+            items = root.findall("./channel/item")
+            if items:
+                entries = []
+                for it in items:
+                    e = {"title": it.findtext("title") or "", "link": (it.findtext("link") or "").strip()}
+                    pub = it.findtext("pubDate")
+                    if pub:
+                        e["published"] = pub
+                    entries.append(e)
+                return entries
+        except etree.XMLSyntaxError:
+            pass
+    return feedparser.parse(content).entries
+
+def fetch_feed_entries(url: str) -> list:
+    """RSS über die gemeinsame Session laden und parsen; Fehler → leere Liste."""
+    try:
+        r = _SESSION.get(url, timeout=TIMEOUT)
+        r.raise_for_status()
+        return parse_rss_entries(r.content)
+    except Exception:
+        return []
+
+def gnews_items(tasks: list) -> list:
+    """(feed_url, source_tag)-Tasks parallel abrufen; Reihenfolge bleibt erhalten."""
+    out = []
+    with ThreadPoolExecutor(max_workers=GNEWS_WORKERS) as ex:
+        results = ex.map(fetch_feed_entries, [url for url, _ in tasks])
+        for (_, tag), entries in zip(tasks, results):
+            for e in entries[:MAX_PER_SOURCE]:
+                out.append(_entry_to_item(e, tag))
+    return out
+
 def norm_url(u: str) -> str:
     try:
         p = ul.urlsplit(u)
@@ -260,9 +414,7 @@ def extract_published_at(html_text: str):
         )
         if not cand: return None
         val = cand.get("content") or cand.get("datetime") or cand.get_text(strip=True)
-        dt = dateparser.parse(val)
-        if dt and dt.tzinfo is None: dt = dt.replace(tzinfo=timezone.utc)
-        return dt
+        return parse_dt(val)
     except Exception:
         return None
 
@@ -273,17 +425,17 @@ def clean_from_html_fragment(fragment: str) -> str:
     text = soup.get_text(" ").strip()
     return re.sub(r"\s+"," ", text)
 
+@lru_cache(maxsize=4096)
 def is_eu_url(url: str) -> bool:
+    # endswith(tuple) prüft alle TLDs in einem C-Aufruf; Ergebnis je URL gecacht
     try:
-        netloc = ul.urlsplit(url).netloc.lower()
-        return netloc.endswith(EU_TLDS) or any(netloc.endswith(tld) for tld in EU_TLDS)
+        return ul.urlsplit(url).netloc.lower().endswith(EU_TLDS)
     except Exception:
         return False
 
 def has_ecom_keywords(text: str) -> bool:
     if not text: return False
-    low = text.lower()
-    return any(k in low for k in ECOM_KEYWORDS)
+    return _ECOM_RE.search(text) is not None
 
 # ============================== Quellen-Finder ================================
 def discover_from_newsroom(index_url=NEWS_INDEX, max_items=MAX_PER_SOURCE):
@@ -317,29 +469,18 @@ def gnews_url(query: str, lang="de", gl="DE", ceid="DE:de", hours=LOOKBACK_HOURS
 
 def discover_from_gnews_queries(company=COMPANY):
     """EU-fokussierte GNews: Firmen-Query + E-Commerce-Queries über EU-Editionen."""
-    out = []
+    tasks = []
     # 1) generische Firmenabfrage je EU Edition
     base_query = f'"{company}"'
     for lang, gl, ceid in EU_GNEWS:
-        url = gnews_url(base_query, lang=lang, gl=gl, ceid=ceid)
-        try:
-            feed = feedparser.parse(url)
-            for e in feed.entries[:MAX_PER_SOURCE]:
-                out.append(_entry_to_item(e, f"gnews:{gl.lower()}:{lang}"))
-        except Exception:
-            pass
+        tasks.append((gnews_url(base_query, lang=lang, gl=gl, ceid=ceid), f"gnews:{gl.lower()}:{lang}"))
     # 2) E-Commerce-Queries je Edition
     for template in ECOM_QUERIES:
         q = template.format(company=company)
         for lang, gl, ceid in EU_GNEWS:
-            url = gnews_url(q, lang=lang, gl=gl, ceid=ceid)
-            try:
-                feed = feedparser.parse(url)
-                for e in feed.entries[:MAX_PER_SOURCE]:
-                    out.append(_entry_to_item(e, f"gnews-ecom:{gl.lower()}:{lang}"))
-            except Exception:
-                pass
-    return out
+            tasks.append((gnews_url(q, lang=lang, gl=gl, ceid=ceid), f"gnews-ecom:{gl.lower()}:{lang}"))
+    # alle Feeds parallel (I/O-gebunden), Ergebnis in Task-Reihenfolge
+    return gnews_items(tasks)
 
 def _entry_to_item(e, source_tag):
     link  = e.get("link") or ""
@@ -396,19 +537,14 @@ def discover_from_linkedin_rss(max_items=MAX_PER_SOURCE):
 
 def discover_from_gnews_linkedin(company=COMPANY):
     """Best-Effort: site:linkedin.com – EU Editionen."""
-    out = []
+    tasks = []
     when_days = max(1, math.ceil(LOOKBACK_HOURS/24))
     for lang, gl, ceid in EU_GNEWS:
         base = "https://news.google.com/rss/search"
         q = f'"{company}" site:linkedin.com when:{when_days}d'
         url = base + "?" + ul.urlencode({"q": q, "hl": lang, "gl": gl, "ceid": ceid})
-        try:
-            feed = feedparser.parse(url)
-            for e in feed.entries[:MAX_PER_SOURCE]:
-                out.append(_entry_to_item(e, f"linkedin:gnews:{gl.lower()}:{lang}"))
-        except Exception:
-            pass
-    return out
+        tasks.append((url, f"linkedin:gnews:{gl.lower()}:{lang}"))
+    return gnews_items(tasks)
 
 # =============================== LLM =========================================
 def llm_batch_signals(company: str, texts: list[dict], limit=SIGNAL_LIMIT) -> list[dict]:
@@ -588,8 +724,7 @@ def main():
 
         dt = it.get("published_at")
         if dt:
-            try: dt = dateparser.parse(dt)
-            except: dt = None
+            dt = parse_dt(dt)
         if not isinstance(dt, datetime) and html_:
             dt = extract_published_at(html_)
 
@@ -619,7 +754,7 @@ def main():
             fresh_bonus=1.0/hours
         url=a.get("url","")
         eu_bonus=0.5 if is_eu_url(url) else 0.0
-        ecom_bonus=0.4 if (has_ecom_keywords(a.get("title","")) or has_ecom_keywords(a.get("text",""))) else 0.0
+        ecom_bonus=0.4 if has_ecom_keywords(a.get("title","") + "\n" + a.get("text","")) else 0.0
         li_bonus=0.2 if ("linkedin" in a.get("source","")) else 0.0
         return L/1500.0 + fresh_bonus + eu_bonus + ecom_bonus + li_bonus
 
@@ -669,8 +804,7 @@ def main():
             "ecommerce_bias": True
         }
     }
-    with open("data/latest.json", "w", encoding="utf-8") as f:
-        json.dump(out, f, ensure_ascii=False, indent=2)
+    write_json("data/latest.json", out)
 
     eu_count = sum(1 for s in sources if is_eu_url(s.get("url","")))
     print(f"Wrote data/latest.json with {len(signals)} signals; sources={len(sources)} (EU={eu_count}); selected={len(selected)}.")
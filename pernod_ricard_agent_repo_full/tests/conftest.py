@@ -0,0 +1,21 @@
+"""
+Shared pytest fixtures.
+"""
+
+import pytest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import utils.disk_cache as disk_cache_module
+import core.scraper as scraper_module
+
+
+@pytest.fixture(autouse=True)
+def isolated_caches(tmp_path, monkeypatch):
+    """Keep scraper disk and HTTP caches out of the real user cache directory."""
+    monkeypatch.setattr(disk_cache_module, "DEFAULT_CACHE_PATH", str(tmp_path / "cache.sqlite3"))
+    monkeypatch.setattr(scraper_module, "ENRICH_CACHE_PATH", str(tmp_path / "enriched.sqlite3"))
+    monkeypatch.setattr(scraper_module, "HTTP_CACHE_PATH", str(tmp_path / "http_cache"))
@@ -1,9 +1,201 @@
-# test_extractor.py
-from extractor import call_llm_extract
+"""
+Tests for SignalExtractor batching (offline, LLM client stubbed).
+"""
 
-SAMPLE = "Pernod Ricard reports FY25 net sales €10.959bn, organic -3.0%; China sales down c.21%."
+import pytest
+import sys
+import os
+import json
+from types import SimpleNamespace
 
-def test_extract_basic():
-    res = call_llm_extract(SAMPLE)
-    assert res.company.lower().startswith('pernod')
-    assert any(s.type == 'Financials' for s in res.signals)
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip("openai")
+
+import extractor as extractor_module
+from extractor import SignalExtractor, _load_prompt
+
+
+# ==============================================================================
+# HELPERS
+# ==============================================================================
+
+def make_signal(url: str) -> dict:
+    """Raw signal dict that passes Pydantic validation."""
+    return {
+        "type": "ecommerce",
+        "verbatim_quote": "online sales grew strongly this quarter",
+        "source_title": "Article title",
+        "source_url": url,
+        "confidence": 0.6,
+        "extraction_reasoning": "explicitly stated in the article",
+        "value": {"headline": "Online growth", "fact": "Online sales grew strongly"}
+    }
+
+
+class StubCompletions:
+    """Stands in for client.chat.completions; replies via a handler(messages)."""
+    
+    def __init__(self, handler):
+        self.handler = handler
+        self.calls = []
+    
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        reply = self.handler(kwargs["messages"])
+        content = reply if isinstance(reply, str) else json.dumps(reply)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+def make_extractor(handler, **kwargs) -> tuple:
+    """Extractor whose LLM client is a StubCompletions."""
+    extractor = SignalExtractor(api_key="test-key", **kwargs)
+    completions = StubCompletions(handler)
+    extractor.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return extractor, completions
+
+
+def batch_items(messages) -> list:
+    """Article items sent in a batched request (None for single-article requests)."""
+    user = messages[1]["content"]
+    if not user.startswith("**ARTICLES:**"):
+        return None
+    return json.loads(user[user.index("["):])
+
+
+def single_url(messages) -> str:
+    """Article URL sent in a single-article request."""
+    return messages[1]["content"].split("**ARTICLE URL:**")[1].strip()
+
+
+def article(i: int) -> tuple:
+    """(text, title, url) article tuple long enough for extraction."""
+    return ("Article text about e-commerce growth. " * 3, f"Title {i}", f"https://example.com/{i}")
+
+
+# ==============================================================================
+# PROMPT TESTS
+# ==============================================================================
+
+def test_load_prompt_splits_article_sections():
+    """Test instructions/response format go to the system part, article fields to the user part."""
+    instructions, article_part = _load_prompt("extract_signals_v2.txt")
+    
+    assert "{article_text}" in article_part and "{article_url}" in article_part
+    assert "{article_text}" not in instructions
+    assert "**YOUR RESPONSE:**" in instructions
+    assert _load_prompt("extract_signals_v2.txt") is _load_prompt("extract_signals_v2.txt")
+
+
+# ==============================================================================
+# BATCHING TESTS
+# ==============================================================================
+
+def test_make_batches_count_and_size_limits(monkeypatch):
+    """Test batches respect batch_size and BATCH_MAX_CHARS."""
+    extractor, _ = make_extractor(lambda messages: {}, batch_size=3)
+    
+    small = [("x" * 100, "t", f"u{i}") for i in range(7)]
+    assert [len(b) for b in extractor._make_batches(small)] == [3, 3, 1]
+    
+    monkeypatch.setattr(extractor_module, "BATCH_MAX_CHARS", 250)
+    assert [len(b) for b in extractor._make_batches(small)] == [2, 2, 2, 1]
+
+
+def test_batch_routes_signals_by_id():
+    """Test signals are routed back by id; bad ids and entries are ignored."""
+    def handler(messages):
+        items = batch_items(messages)
+        entries = [{"id": item["id"], "signals": [make_signal(item["url"])]} for item in reversed(items)]
+        entries += [
+            {"id": 99, "signals": [make_signal("https://example.com/out-of-range")]},
+            {"id": "0", "signals": [make_signal("https://example.com/string-id")]},
+            "not an entry",
+        ]
+        return {"signals_by_article": entries}
+    
+    extractor, completions = make_extractor(handler)
+    results = extractor.extract_from_batch([article(i) for i in range(3)], "ACME")
+    
+    assert len(completions.calls) == 1
+    assert [[s.source_url for s in signals] for signals in results] == [
+        ["https://example.com/0"], ["https://example.com/1"], ["https://example.com/2"]
+    ]
+    assert extractor.stats["articles_processed"] == 3
+
+
+def test_batch_falls_back_on_malformed_response():
+    """Test a batch reply without signals_by_article is retried article by article."""
+    def handler(messages):
+        if batch_items(messages) is not None:
+            return {"signals": []}
+        return {"signals": [make_signal(single_url(messages))]}
+    
+    extractor, completions = make_extractor(handler)
+    results = extractor.extract_from_batch([article(i) for i in range(2)], "ACME")
+    
+    assert len(completions.calls) == 3
+    assert [[s.source_url for s in signals] for signals in results] == [
+        ["https://example.com/0"], ["https://example.com/1"]
+    ]
+    assert extractor.stats["articles_processed"] == 2
+    assert extractor.stats["api_errors"] == 0
+
+
+def test_batch_falls_back_on_context_length_exceeded():
+    """Test context_length_exceeded triggers single requests; other errors don't."""
+    class ContextLengthError(Exception):
+        code = "context_length_exceeded"
+    
+    def handler(messages):
+        if batch_items(messages) is not None:
+            raise ContextLengthError("too long")
+        return {"signals": [make_signal(single_url(messages))]}
+    
+    extractor, completions = make_extractor(handler)
+    results = extractor.extract_from_batch([article(i) for i in range(2)], "ACME")
+    
+    assert len(completions.calls) == 3
+    assert all(len(signals) == 1 for signals in results)
+    
+    def failing(messages):
+        raise RuntimeError("service unavailable")
+    
+    extractor, completions = make_extractor(failing)
+    results = extractor.extract_from_batch([article(i) for i in range(2)], "ACME")
+    
+    assert len(completions.calls) == 1
+    assert results == [[], []]
+    assert extractor.stats["api_errors"] == 1
+
+
+def test_extract_from_sources_keeps_source_order():
+    """Test batched, concurrent extraction returns signals in source order."""
+    def handler(messages):
+        items = batch_items(messages)
+        if items is None:
+            return {"signals": [make_signal(single_url(messages))]}
+        return {"signals_by_article": [
+            {"id": item["id"], "signals": [make_signal(item["url"])]} for item in items
+        ]}
+    
+    extractor, completions = make_extractor(handler, batch_size=2)
+    sources = [
+        {"text": text, "title": title, "url": url}
+        for text, title, url in (article(i) for i in range(5))
+    ]
+    sources.insert(2, {"text": "too short", "url": "https://example.com/short"})
+    
+    signals = extractor.extract_from_sources(sources, "ACME")
+    
+    assert [s["source_url"] for s in signals] == [f"https://example.com/{i}" for i in range(5)]
+    assert len(completions.calls) == 3  # batches of 2, 2 and a single article
+
+
+# ==============================================================================
+# RUN TESTS
+# ==============================================================================
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -9,8 +9,9 @@ import os
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from core.scraper import CompanyIntelligenceScraper, discover_company_sources
-from utils.url_utils import guess_domain_from_company_name, is_eu_url, normalize_url
+from core.scraper import CompanyIntelligenceScraper, discover_company_sources, _parse_date
+from utils.disk_cache import DiskCache
+from utils.url_utils import guess_domain_from_company_name, is_eu_url, normalize_url, canonicalize_url, url_fingerprint
 
 
 # ==============================================================================
@@ -61,6 +62,27 @@ def test_url_normalization_trailing_slash():
     assert normalize_url(url1) == normalize_url(url2)
 
 
+def test_url_canonicalization():
+    """Test canonical URL fingerprint ignores tracking params, www and default ports."""
+    canonical = canonicalize_url("https://example.com/article?id=123")
+    
+    assert canonicalize_url("https://www.example.com:443/article/?id=123&utm_source=x&fbclid=abc") == canonical
+    assert canonicalize_url("HTTPS://Example.com/article?_=1700000000&id=123#comments") == canonical
+    
+    # Different article IDs stay different
+    assert canonicalize_url("https://example.com/article?id=124") != canonical
+    assert canonicalize_url("https://example.com/news/123") != canonicalize_url("https://example.com/news/124")
+
+
+def test_url_fingerprint():
+    """Test 64-bit URL fingerprint follows canonicalization."""
+    fp = url_fingerprint("https://example.com/article?id=123")
+    
+    assert isinstance(fp, int) and 0 <= fp < 2 ** 64
+    assert url_fingerprint("https://www.example.com/article/?id=123&utm_source=x") == fp
+    assert url_fingerprint("https://example.com/article?id=124") != fp
+
+
 def test_eu_url_detection():
     """Test EU domain detection."""
     eu_urls = [
@@ -103,7 +125,8 @@ def test_scraper_initialization_with_config():
         "domain": "custom.com",
         "lookback_days": 30,
         "max_per_source": 20,
-        "newsroom_url": "https://custom.com/news"
+        "newsroom_url": "https://custom.com/news",
+        "enrich_workers": 4
     }
     
     scraper = CompanyIntelligenceScraper("Test Company", config)
@@ -112,6 +135,7 @@ def test_scraper_initialization_with_config():
     assert scraper.lookback_days == 30
     assert scraper.max_per_source == 20
     assert scraper.newsroom_url == "https://custom.com/news"
+    assert scraper.enrich_workers == 4
 
 
 # ==============================================================================
@@ -151,6 +175,19 @@ def test_source_deduplication():
     assert deduplicated[0]["url"] != deduplicated[1]["url"]
 
 
+def test_source_deduplication_tracking_variants():
+    """Test that tracking-parameter variants of a URL are deduplicated."""
+    sources = [
+        {"url": "https://example.com/article?id=1", "title": "Article 1"},
+        {"url": "https://www.example.com/article/?id=1&utm_campaign=feed", "title": "Article 1 (tracked)"},
+    ]
+    
+    scraper = CompanyIntelligenceScraper("Test")
+    deduplicated = scraper._deduplicate_sources(sources)
+    
+    assert [s["title"] for s in deduplicated] == ["Article 1"]
+
+
 # ==============================================================================
 # E-COMMERCE KEYWORD DETECTION TESTS
 # ==============================================================================
@@ -182,6 +219,134 @@ def test_ecommerce_keyword_detection():
         assert not scraper._has_ecommerce_keywords(text), f"Should not detect e-commerce in: {text}"
 
 
+def test_pdf_keyword_scan_matches_separate_checks():
+    """Test fused PDF keyword scan agrees with the individual checks."""
+    from utils.pdf_utils import is_earnings_report_pdf
+    
+    scraper = CompanyIntelligenceScraper("Test")
+    texts = [
+        "Quarterly results: revenue and net income up, e-commerce grew 20%. " * 5,
+        "Financial results with revenue, profit and ebitda for the fiscal year. " * 5,
+        "New marketplace strategy announced",
+        "Company opens new factory",
+        "",
+    ]
+    
+    for text in texts:
+        expected = (scraper._has_ecommerce_keywords(text), is_earnings_report_pdf(text))
+        assert scraper._scan_pdf_keywords(text) == expected, text
+
+
+# ==============================================================================
+# DATE PARSING TESTS
+# ==============================================================================
+
+def test_date_parsing_formats():
+    """Test feed/page date formats all parse to aware UTC datetimes."""
+    iso = _parse_date("2024-03-05T10:00:00Z")
+    rfc = _parse_date("Tue, 05 Mar 2024 10:00:00 GMT")
+    
+    assert iso == rfc
+    assert iso.tzinfo is not None
+    
+    # DD.MM.YYYY is day-first (not March 5th → May 3rd)
+    de = _parse_date("05.03.2024")
+    assert (de.year, de.month, de.day) == (2024, 3, 5)
+    assert de.tzinfo is not None
+    
+    assert _parse_date("") is None
+    assert _parse_date("not a date") is None
+
+
+# ==============================================================================
+# ENRICHMENT TESTS
+# ==============================================================================
+
+def test_html_size_cap_with_http_cache(monkeypatch):
+    """Test streamed article fetches bypass the HTTP cache so MAX_HTML_BYTES holds."""
+    pytest.importorskip("requests_cache")
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    import core.scraper as scraper_module
+    
+    class BigPage(BaseHTTPRequestHandler):
+        def do_GET(self):
+            # No Content-Length: body ends when the connection closes
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.end_headers()
+            self.wfile.write(b"<html><body><p>" + b"a" * 5_600_000 + b"</p></body></html>")
+        
+        def log_message(self, *args):
+            pass
+    
+    server = ThreadingHTTPServer(("127.0.0.1", 0), BigPage)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/article"
+    
+    unread = []
+    read_html = scraper_module.CompanyIntelligenceScraper._read_html
+    
+    def checked_read_html(response):
+        unread.append(response._content is False)  # body not pulled in before streaming
+        return read_html(response)
+    
+    monkeypatch.setattr(scraper_module.CompanyIntelligenceScraper, "_read_html", staticmethod(checked_read_html))
+    
+    try:
+        scraper = CompanyIntelligenceScraper("Test", {"http_cache": True, "disk_cache": False})
+        source, success = scraper._enrich_one({"url": url})
+    finally:
+        server.shutdown()
+    
+    assert success
+    assert unread == [True]
+    assert len(source["raw_text"]) <= scraper_module.MAX_HTML_BYTES
+    assert not list(scraper.session.cache.responses.keys())
+
+
+def test_html_truncation_keeps_utf8(monkeypatch):
+    """Test a multi-byte character split by MAX_HTML_BYTES does not force a bytes fallback."""
+    from types import SimpleNamespace
+    import core.scraper as scraper_module
+    
+    body = "<p>Größe</p>".encode("utf-8")
+    cut = body.index("ö".encode("utf-8")) + 1  # inside the two-byte "ö"
+    response = SimpleNamespace(
+        headers={"Content-Type": "text/html"},
+        encoding=None,
+        iter_content=lambda size: iter([body])
+    )
+    
+    monkeypatch.setattr(scraper_module, "MAX_HTML_BYTES", cut)
+    assert CompanyIntelligenceScraper._read_html(response) == "<p>Gr"
+    
+    monkeypatch.setattr(scraper_module, "MAX_HTML_BYTES", len(body))
+    assert CompanyIntelligenceScraper._read_html(response) == "<p>Größe</p>"
+
+
+# ==============================================================================
+# DISK CACHE TESTS
+# ==============================================================================
+
+def test_disk_cache_private_and_purged(tmp_path):
+    """Test cache file is user-only and expired rows are dropped on open."""
+    path = str(tmp_path / "cache" / "cache.sqlite3")
+    
+    cache = DiskCache(path)
+    cache.set("old", {"raw_text": "x"})
+    cache._conn.execute("UPDATE cache SET created_at = created_at - 7200")
+    cache.set("new", {"raw_text": "y"})
+    cache._conn.commit()
+    
+    assert os.stat(path).st_mode & 0o777 == 0o600
+    assert os.stat(os.path.dirname(path)).st_mode & 0o777 == 0o700
+    
+    reopened = DiskCache(path, max_age=3600)
+    assert reopened.get("new") == {"raw_text": "y"}
+    assert reopened._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0] == 1
+
+
 # ==============================================================================
 # INTEGRATION TESTS (require network, mark as slow)
 # ==============================================================================
@@ -0,0 +1,182 @@
+"""
+Persistent key-value cache (SQLite) with per-read TTL.
+
+Used by the scraper to remember slow-changing lookups across runs
+(e.g. which IR/newsroom URL exists for a domain).
+"""
+
+import os
+import json
+import time
+import sqlite3
+import logging
+import threading
+from typing import Any, Optional
+
+# optional: faster JSON (de)serialization
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+def user_cache_dir() -> str:
+    """
+    Per-user cache directory ($XDG_CACHE_HOME or ~/.cache, then ecommerce_intel).
+    
+    Not created here; see ensure_private_dir().
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "ecommerce_intel")
+
+
+def ensure_private_dir(path: str):
+    """
+    Create a directory readable only by the current user (0700).
+    
+    Raises:
+        OSError: If it can't be created or belongs to another user
+    """
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    if hasattr(os, "getuid") and os.stat(path).st_uid != os.getuid():
+        raise PermissionError(f"{path} is owned by another user")
+
+
+# Default cache file (override with SCRAPER_CACHE_PATH)
+DEFAULT_CACHE_PATH = os.environ.get(
+    "SCRAPER_CACHE_PATH",
+    os.path.join(user_cache_dir(), "cache.sqlite3")
+)
+
+
+def _dumps(value: Any) -> str:
+    """Serialize to a JSON string (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _loads(data: str) -> Any:
+    """Parse a JSON string (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class DiskCache:
+    """
+    Small thread-safe JSON key-value store backed by SQLite.
+    
+    The file lives in a private (0700) directory and is created 0600, since
+    cached page text is fed to the LLM. Errors (unwritable path, corrupt
+    file, file owned by another user) are logged and treated as cache
+    misses, so callers never fail because of the cache.
+    """
+    
+    def __init__(self, path: Optional[str] = None, max_age: Optional[float] = None):
+        """
+        Initialize cache.
+        
+        Args:
+            path: SQLite file path, created if missing (default: DEFAULT_CACHE_PATH)
+            max_age: Delete entries older than this on open, in seconds
+                (None = keep everything); should be the longest TTL callers read with
+        """
+        path = path or DEFAULT_CACHE_PATH
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = None
+        
+        try:
+            ensure_private_dir(os.path.dirname(os.path.abspath(path)))
+            os.close(os.open(path, os.O_RDWR | os.O_CREAT, 0o600))
+            if hasattr(os, "getuid") and os.stat(path).st_uid != os.getuid():
+                raise PermissionError(f"{path} is owned by another user")
+            os.chmod(path, 0o600)
+            
+            self._conn = sqlite3.connect(path, check_same_thread=False, timeout=5)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            if max_age is not None:
+                # Expired rows are never read again; drop them so the file stays bounded
+                self._conn.execute("DELETE FROM cache WHERE created_at < ?", (time.time() - max_age,))
+            self._conn.commit()
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Disk cache disabled ({path}): {e}")
+            if self._conn is not None:
+                self._conn.close()
+            self._conn = None
+    
+    @property
+    def enabled(self) -> bool:
+        """True if the cache file could be opened."""
+        return self._conn is not None
+    
+    def get(self, key: str, max_age: Optional[float] = None) -> Any:
+        """
+        Get a cached value.
+        
+        Args:
+            key: Cache key
+            max_age: Max entry age in seconds (None = no expiry)
+        
+        Returns:
+            Cached value, or None if missing/expired
+        """
+        if not self._conn:
+            return None
+        
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value, created_at FROM cache WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Disk cache read failed: {e}")
+            return None
+        
+        if not row:
+            return None
+        
+        value, created_at = row
+        if max_age is not None and time.time() - created_at > max_age:
+            return None
+        
+        return _loads(value)
+    
+    def set(self, key: str, value: Any):
+        """
+        Store a JSON-serializable value.
+        
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        if not self._conn:
+            return
+        
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, value, created_at) VALUES (?, ?, ?)",
+                    (key, _dumps(value), time.time())
+                )
+                self._conn.commit()
+        except (sqlite3.Error, TypeError, ValueError) as e:  # orjson.JSONEncodeError is a TypeError
+            logger.warning(f"Disk cache write failed: {e}")
+    
+    def delete(self, key: str):
+        """Remove a key (no-op if missing)."""
+        if not self._conn:
+            return
+        
+        try:
+            with self._lock:
+                self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Disk cache delete failed: {e}")
@@ -0,0 +1,46 @@
+"""
+Logging setup for the pipeline (scraper, validators, engine).
+
+Worker threads only enqueue records; a single listener thread writes them
+to stderr, so parallel discovery/enrichment doesn't contend on the stream
+or interleave lines.
+"""
+
+import sys
+import atexit
+import queue
+import logging
+import logging.handlers
+
+# Project loggers that report progress at INFO (third-party stays at WARNING)
+PROJECT_LOGGERS = ("core", "utils", "validators", "extractor", "db")
+
+_listener = None
+
+
+def setup_logging(level: int = logging.INFO):
+    """
+    Route log records through a queue to one stderr writer.
+    
+    Safe to call repeatedly (e.g. on every Streamlit rerun); only the first
+    call installs handlers.
+    
+    Args:
+        level: Level for the project loggers
+    """
+    global _listener
+    if _listener is not None:
+        return
+    
+    log_queue = queue.Queue(-1)
+    
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    _listener.start()
+    atexit.register(_listener.stop)
+    
+    logging.getLogger().addHandler(logging.handlers.QueueHandler(log_queue))
+    for name in PROJECT_LOGGERS:
+        logging.getLogger(name).setLevel(level)
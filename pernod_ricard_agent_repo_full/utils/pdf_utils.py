@@ -13,10 +13,25 @@ try:
 except ImportError:
     PDF_AVAILABLE = False
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
+# Download limit for PDFs (bytes); larger files are skipped
+MAX_PDF_BYTES = 30 * 1024 * 1024
+
+# Chunk size for streamed PDF downloads
+PDF_CHUNK_SIZE = 64 * 1024
+
 
-def extract_text_from_pdf(pdf_content: bytes, max_pages: int = 50) -> Optional[str]:
+def extract_text_from_pdf(
+    pdf_content: bytes,
+    max_pages: int = 50,
+    max_chars: Optional[int] = None
+) -> Optional[str]:
     """
     Extract text from PDF content.
     
@@ -25,6 +40,7 @@ def extract_text_from_pdf(pdf_content: bytes, max_pages: int = 50) -> Optional[s
     Args:
         pdf_content: Raw PDF bytes
         max_pages: Maximum pages to process (to avoid huge files)
+        max_chars: Stop after this many characters of text (None = no limit)
     
     Returns:
         Extracted text or None if failed
@@ -35,7 +51,7 @@ def extract_text_from_pdf(pdf_content: bytes, max_pages: int = 50) -> Optional[s
     
     # Try pdfplumber first (better quality)
     try:
-        text = _extract_with_pdfplumber(pdf_content, max_pages)
+        text = _extract_with_pdfplumber(pdf_content, max_pages, max_chars)
         if text and len(text.strip()) > 100:
             return text
     except Exception as e:
@@ -43,7 +59,7 @@ def extract_text_from_pdf(pdf_content: bytes, max_pages: int = 50) -> Optional[s
     
     # Fallback to PyPDF2
     try:
-        text = _extract_with_pypdf2(pdf_content, max_pages)
+        text = _extract_with_pypdf2(pdf_content, max_pages, max_chars)
         if text and len(text.strip()) > 100:
             return text
     except Exception as e:
@@ -52,10 +68,11 @@ def extract_text_from_pdf(pdf_content: bytes, max_pages: int = 50) -> Optional[s
     return None
 
 
-def _extract_with_pdfplumber(pdf_content: bytes, max_pages: int) -> Optional[str]:
+def _extract_with_pdfplumber(pdf_content: bytes, max_pages: int, max_chars: Optional[int] = None) -> Optional[str]:
     """Extract text using pdfplumber (preferred method)."""
     with pdfplumber.open(io.BytesIO(pdf_content)) as pdf:
         text_parts = []
+        total_chars = 0
         
         for page_num, page in enumerate(pdf.pages):
             if page_num >= max_pages:
@@ -64,14 +81,18 @@ def _extract_with_pdfplumber(pdf_content: bytes, max_pages: int) -> Optional[str
             page_text = page.extract_text()
             if page_text:
                 text_parts.append(page_text)
+                total_chars += len(page_text)
+                if max_chars and total_chars >= max_chars:
+                    break
         
         return "\n\n".join(text_parts)
 
 
-def _extract_with_pypdf2(pdf_content: bytes, max_pages: int) -> Optional[str]:
+def _extract_with_pypdf2(pdf_content: bytes, max_pages: int, max_chars: Optional[int] = None) -> Optional[str]:
     """Extract text using PyPDF2 (fallback method)."""
     pdf_reader = PyPDF2.PdfReader(io.BytesIO(pdf_content))
     text_parts = []
+    total_chars = 0
     
     num_pages = min(len(pdf_reader.pages), max_pages)
     
@@ -80,10 +101,40 @@ def _extract_with_pypdf2(pdf_content: bytes, max_pages: int) -> Optional[str]:
         page_text = page.extract_text()
         if page_text:
             text_parts.append(page_text)
+            total_chars += len(page_text)
+            if max_chars and total_chars >= max_chars:
+                break
     
     return "\n\n".join(text_parts)
 
 
+# Keywords that indicate earnings/financial reports
+EARNINGS_KEYWORDS = (
+    'quarterly report', 'earnings', 'revenue', 'profit', 'loss',
+    'financial results', 'quarterly results', 'q1', 'q2', 'q3', 'q4',
+    'fiscal year', 'net income', 'operating income', 'ebitda',
+    'sales growth', 'year-over-year', 'yoy', 'balance sheet',
+    'cash flow', 'investor relations', 'ir', 'earnings call'
+)
+
+# Minimum number of distinct keywords for a PDF to count as earnings report
+EARNINGS_MIN_MATCHES = 3
+
+
+def _build_keyword_automaton(keywords):
+    """Build an Aho-Corasick automaton over keywords (None if pyahocorasick is missing)."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for kw in keywords:
+        automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    return automaton
+
+
+_EARNINGS_AUTOMATON = _build_keyword_automaton(EARNINGS_KEYWORDS)
+
+
 def is_pdf_url(url: str) -> bool:
     """
     Check if URL points to a PDF file.
@@ -103,13 +154,30 @@ def is_pdf_url(url: str) -> bool:
     )
 
 
-def extract_text_from_pdf_url(pdf_url: str, timeout: int = 30) -> Optional[str]:
+def extract_text_from_pdf_url(
+    pdf_url: str,
+    timeout: int = 30,
+    session=None,
+    max_pages: int = 50,
+    max_chars: Optional[int] = None,
+    max_bytes: int = MAX_PDF_BYTES
+) -> Optional[str]:
     """
     Download and extract text from PDF URL.
     
+    The body is streamed: the content type and Content-Length are checked
+    before anything is downloaded, and the download is aborted once it
+    exceeds max_bytes.
+    
     Args:
         pdf_url: URL to PDF file
         timeout: Request timeout in seconds
+        session: Optional requests.Session to reuse pooled connections (not a
+            requests-cache CachedSession: it reads the whole body before the
+            size checks run)
+        max_pages: Maximum pages to parse
+        max_chars: Stop parsing after this many characters (None = no limit)
+        max_bytes: Maximum download size in bytes
     
     Returns:
         Extracted text or None
@@ -117,23 +185,38 @@ def extract_text_from_pdf_url(pdf_url: str, timeout: int = 30) -> Optional[str]:
     import requests
     
     try:
-        response = requests.get(
+        with (session or requests).get(
             pdf_url,
             timeout=timeout,
             headers={
                 'User-Agent': 'Mozilla/5.0 (compatible; E-Commerce-Intelligence-Bot/1.0)'
             },
-            allow_redirects=True
-        )
-        response.raise_for_status()
-        
-        # Check content type
-        content_type = response.headers.get('content-type', '').lower()
-        if 'pdf' not in content_type:
-            logger.warning(f"URL did not return PDF: {content_type}")
-            return None
+            allow_redirects=True,
+            stream=True
+        ) as response:
+            response.raise_for_status()
+            
+            # Check content type (before downloading the body)
+            content_type = response.headers.get('content-type', '').lower()
+            if 'pdf' not in content_type:
+                logger.warning(f"URL did not return PDF: {content_type}")
+                return None
+            
+            content_length = response.headers.get('content-length', '')
+            if content_length.isdigit() and int(content_length) > max_bytes:
+                logger.warning(f"PDF too large ({content_length} bytes): {pdf_url}")
+                return None
+            
+            chunks = []
+            size = 0
+            for chunk in response.iter_content(chunk_size=PDF_CHUNK_SIZE):
+                size += len(chunk)
+                if size > max_bytes:
+                    logger.warning(f"PDF exceeds {max_bytes} bytes, skipped: {pdf_url}")
+                    return None
+                chunks.append(chunk)
         
-        return extract_text_from_pdf(response.content)
+        return extract_text_from_pdf(b"".join(chunks), max_pages=max_pages, max_chars=max_chars)
     
     except Exception as e:
         logger.error(f"Failed to download/parse PDF from {pdf_url}: {e}")
@@ -155,19 +238,19 @@ def is_earnings_report_pdf(text: str) -> bool:
     
     text_lower = text.lower()
     
-    # Keywords that indicate earnings/financial reports
-    earnings_keywords = [
-        'quarterly report', 'earnings', 'revenue', 'profit', 'loss',
-        'financial results', 'quarterly results', 'q1', 'q2', 'q3', 'q4',
-        'fiscal year', 'net income', 'operating income', 'ebitda',
-        'sales growth', 'year-over-year', 'yoy', 'balance sheet',
-        'cash flow', 'investor relations', 'ir', 'earnings call'
-    ]
+    # Single pass over the text; stop as soon as enough distinct keywords are seen
+    if _EARNINGS_AUTOMATON is not None:
+        found = set()
+        for _, kw in _EARNINGS_AUTOMATON.iter(text_lower):
+            found.add(kw)
+            if len(found) >= EARNINGS_MIN_MATCHES:
+                return True
+        return False
     
-    # Check if at least 3 keywords present
-    matches = sum(1 for kw in earnings_keywords if kw in text_lower)
+    # Fallback: one substring scan per keyword
+    matches = sum(1 for kw in EARNINGS_KEYWORDS if kw in text_lower)
     
-    return matches >= 3
+    return matches >= EARNINGS_MIN_MATCHES
 
 
 def extract_key_metrics_from_text(text: str) -> dict:
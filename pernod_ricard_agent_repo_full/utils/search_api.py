@@ -5,12 +5,37 @@ Uses Google's Custom Search JSON API to find relevant sources.
 
 import os
 import logging
+import threading
 from typing import List, Dict, Optional
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
 
+def _dedupe_by_link(results: List[Dict], limit: int) -> List[Dict]:
+    """
+    Deduplicate search results by link in a single pass (first hit wins).
+    
+    Args:
+        results: Search results (dicts with 'link')
+        limit: Max number of unique results to return
+    
+    Returns:
+        Up to `limit` unique results, in original order
+    """
+    seen_links = set()
+    unique_results = []
+    for result in results:
+        link = result['link']
+        if link in seen_links:
+            continue
+        seen_links.add(link)
+        unique_results.append(result)
+        if len(unique_results) >= limit:
+            break
+    return unique_results
+
+
 class GoogleSearchClient:
     """
     Client for Google Custom Search API.
@@ -36,6 +61,22 @@ class GoogleSearchClient:
         except ImportError:
             logger.warning("google-api-python-client not installed. Search features disabled.")
             self.enabled = False
+        
+        # Built service objects, one per thread (not thread-safe to share)
+        self._local = threading.local()
+    
+    def _get_service(self):
+        """
+        Get the Custom Search service, building it once per thread.
+        
+        build() loads and parses the API discovery document, so doing it for
+        every query is pure overhead.
+        """
+        service = getattr(self._local, 'service', None)
+        if service is None:
+            service = self.build("customsearch", "v1", developerKey=self.api_key)
+            self._local.service = service
+        return service
     
     def search(self, query: str, num_results: int = 10, **kwargs) -> List[Dict]:
         """
@@ -54,11 +95,8 @@ class GoogleSearchClient:
             return []
         
         try:
-            # Build the search service
-            service = self.build("customsearch", "v1", developerKey=self.api_key)
-            
             # Execute the search
-            result = service.cse().list(
+            result = self._get_service().cse().list(
                 q=query,
                 cx=self.search_engine_id,
                 num=min(num_results, 10),  # API max is 10 per request
@@ -112,15 +150,7 @@ class GoogleSearchClient:
             if results:  # If we found something, don't need more queries
                 break
         
-        # Deduplicate by link
-        seen_links = set()
-        unique_results = []
-        for result in all_results:
-            if result['link'] not in seen_links:
-                seen_links.add(result['link'])
-                unique_results.append(result)
-        
-        return unique_results[:10]
+        return _dedupe_by_link(all_results, limit=10)
     
     def search_earnings_reports(self, company: str, year: Optional[int] = None) -> List[Dict]:
         """
@@ -147,15 +177,7 @@ class GoogleSearchClient:
             results = self.search(query, num_results=5)
             all_results.extend(results)
         
-        # Deduplicate
-        seen_links = set()
-        unique_results = []
-        for result in all_results:
-            if result['link'] not in seen_links:
-                seen_links.add(result['link'])
-                unique_results.append(result)
-        
-        return unique_results[:10]
+        return _dedupe_by_link(all_results, limit=10)
     
     def search_ecommerce_news(self, company: str, months_back: int = 3) -> List[Dict]:
         """
@@ -183,15 +205,7 @@ class GoogleSearchClient:
             )
             all_results.extend(results)
         
-        # Deduplicate
-        seen_links = set()
-        unique_results = []
-        for result in all_results:
-            if result['link'] not in seen_links:
-                seen_links.add(result['link'])
-                unique_results.append(result)
-        
-        return unique_results[:15]
+        return _dedupe_by_link(all_results, limit=15)
     
     def search_company_website(self, company: str) -> Optional[str]:
         """
@@ -3,7 +3,9 @@ URL utilities: domain guessing, normalization, EU detection.
 """
 
 import re
-from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
+import hashlib
+from functools import lru_cache
+from urllib.parse import urlparse, urlunparse, urlsplit, urlunsplit, parse_qsl, urlencode
 from typing import Optional
 
 
@@ -15,6 +17,65 @@ EU_TLDS = (
     ".si", ".cy", ".lu", ".mt"
 )
 
+# Legal-form suffixes stripped when guessing a domain
+COMPANY_SUFFIXES = (
+    " se", " ag", " gmbh", " inc", " corp", " ltd", " llc",
+    " s.a.", " n.v.", " b.v.", " plc", " group"
+)
+
+# Known brands whose domain can't be derived from the name
+KNOWN_COMPANY_DOMAINS = {
+    "deutsche-post-dhl": "dhl.com",
+    "deutsche-post": "dhl.com",
+    "dhl": "dhl.com",
+    "coca-cola": "coca-cola.com",
+    "cocacola": "coca-cola.com",
+    "unilever": "unilever.com",
+    "nestle": "nestle.com",
+    "lvmh": "lvmh.com",
+    "pernod-ricard": "pernod-ricard.com",
+    "zalando": "zalando.com",
+    "amazon": "amazon.com",
+    "google": "google.com",
+    "microsoft": "microsoft.com",
+    "apple": "apple.com",
+}
+
+# Path indicators for newsroom/press pages
+NEWSROOM_PATH_INDICATORS = (
+    '/news', '/newsroom', '/press', '/media',
+    '/press-release', '/presse', '/aktuelles'
+)
+
+# Path indicators for investor relations pages
+IR_PATH_INDICATORS = (
+    '/investor', '/ir/', '/shareholder',
+    '/financial-report', '/earnings', '/quarterly'
+)
+
+# URL indicators for earnings/financial reports
+EARNINGS_URL_INDICATORS = (
+    'earnings', 'quarterly', 'q1-', 'q2-', 'q3-', 'q4-',
+    'financial-report', 'annual-report', 'fiscal-year',
+    'results', 'fy20', 'fy21', 'fy22', 'fy23', 'fy24', 'fy25', 'fy26'
+)
+
+# Query parameters dropped by clean_url
+TRACKING_PARAMS = frozenset({
+    'utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content',
+    'fbclid', 'gclid', 'msclkid', '_ga', 'mc_cid', 'mc_eid'
+})
+
+# Additional query parameters ignored when fingerprinting URLs for dedupe
+# (cache busters and session/auth tokens; utm_* and mc_* are matched by prefix)
+FINGERPRINT_IGNORED_PARAMS = TRACKING_PARAMS | frozenset({
+    '_', 'cb', 'session', 'sessionid', 'sid', 'token', 'ref', 'oc'
+})
+FINGERPRINT_IGNORED_PREFIXES = ('utm_', 'mc_')
+
+# Ports dropped from the netloc (default for the scheme)
+DEFAULT_PORTS = {'http': '80', 'https': '443'}
+
 
 def guess_domain_from_company_name(company_name: str) -> str:
     """
@@ -35,9 +96,7 @@ def guess_domain_from_company_name(company_name: str) -> str:
     name = company_name.lower().strip()
     
     # Remove common suffixes
-    suffixes = [" se", " ag", " gmbh", " inc", " corp", " ltd", " llc", 
-                " s.a.", " n.v.", " b.v.", " plc", " group"]
-    for suffix in suffixes:
+    for suffix in COMPANY_SUFFIXES:
         if name.endswith(suffix):
             name = name[:-len(suffix)].strip()
     
@@ -54,33 +113,17 @@ def guess_domain_from_company_name(company_name: str) -> str:
     name = name.strip('-')
     
     # Special cases (known brands)
-    special_cases = {
-        "deutsche-post-dhl": "dhl.com",
-        "deutsche-post": "dhl.com",
-        "dhl": "dhl.com",
-        "coca-cola": "coca-cola.com",
-        "cocacola": "coca-cola.com",
-        "unilever": "unilever.com",
-        "nestle": "nestle.com",
-        "lvmh": "lvmh.com",
-        "pernod-ricard": "pernod-ricard.com",
-        "zalando": "zalando.com",
-        "amazon": "amazon.com",
-        "google": "google.com",
-        "microsoft": "microsoft.com",
-        "apple": "apple.com",
-    }
-    
-    if name in special_cases:
-        return special_cases[name]
+    if name in KNOWN_COMPANY_DOMAINS:
+        return KNOWN_COMPANY_DOMAINS[name]
     
     # Default: add .com
     return f"{name}.com"
 
 
+@lru_cache(maxsize=4096)
 def normalize_url(url: str) -> str:
     """
-    Normalize URL for deduplication.
+    Normalize URL for deduplication (memoized: feeds repeat the same URLs).
     
     - Lowercase
     - Sort query parameters
@@ -118,6 +161,77 @@ def normalize_url(url: str) -> str:
         return url.lower()
 
 
+@lru_cache(maxsize=4096)
+def canonicalize_url(url: str) -> str:
+    """
+    Canonical URL fingerprint for deduplicating sources (memoized).
+    
+    Stricter than normalize_url (which it extends):
+    - Lowercase, drop fragment and trailing slash, sort query parameters
+    - Drop default ports and a leading "www."
+    - Drop tracking/cache-buster/session parameters (utm_*, fbclid, _, cb, ...)
+    
+    Path segments are kept as-is (numeric IDs identify different articles).
+    
+    Args:
+        url: URL to canonicalize
+    
+    Returns:
+        Canonical URL string
+    """
+    try:
+        parts = urlsplit(url.strip().lower())
+        
+        # Host without default port / www.
+        host = parts.hostname or ''
+        if host.startswith('www.'):
+            host = host[4:]
+        port = parts.port
+        if port and str(port) != DEFAULT_PORTS.get(parts.scheme):
+            host = f"{host}:{port}"
+        
+        # Keep only meaningful query parameters, sorted
+        query = urlencode(sorted(
+            (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+            if k not in FINGERPRINT_IGNORED_PARAMS
+            and not k.startswith(FINGERPRINT_IGNORED_PREFIXES)
+        ))
+        
+        path = parts.path.rstrip('/')
+        
+        return urlunsplit((parts.scheme, host, path, query, ''))
+    except Exception:
+        return normalize_url(url)
+
+
+@lru_cache(maxsize=4096)
+def _split(url: str):
+    """
+    Cached urlsplit (index pages run several URL helpers on every link).
+    
+    Args:
+        url: URL to split
+    
+    Returns:
+        urllib.parse.SplitResult
+    """
+    return urlsplit(url)
+
+
+def url_fingerprint(url: str) -> int:
+    """
+    64-bit fingerprint of the canonical URL (compact key for "seen" sets).
+    
+    Args:
+        url: URL to fingerprint
+    
+    Returns:
+        Unsigned 64-bit int (equal for URLs with the same canonicalize_url)
+    """
+    digest = hashlib.blake2b(canonicalize_url(url).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
 def is_eu_url(url: str) -> bool:
     """
     Check if URL is from EU domain.
@@ -129,15 +243,14 @@ def is_eu_url(url: str) -> bool:
         True if EU domain, False otherwise
     """
     try:
-        parsed = urlparse(url)
-        netloc = parsed.netloc.lower()
+        netloc = _split(url).netloc.lower()
         
         # Remove port if present
         if ':' in netloc:
             netloc = netloc.split(':')[0]
         
-        # Check TLD
-        return any(netloc.endswith(tld) for tld in EU_TLDS)
+        # Check TLD (str.endswith with a tuple is a single C-level call)
+        return netloc.endswith(EU_TLDS)
     except Exception:
         return False
 
@@ -153,8 +266,7 @@ def extract_domain(url: str) -> Optional[str]:
         Domain (e.g. "example.com") or None
     """
     try:
-        parsed = urlparse(url)
-        netloc = parsed.netloc.lower()
+        netloc = _split(url).netloc.lower()
         
         # Remove port
         if ':' in netloc:
@@ -321,7 +433,7 @@ def build_company_blog_candidates(domain: str) -> list[str]:
 def is_linkedin_url(url: str) -> bool:
     """Check if URL is from LinkedIn."""
     try:
-        netloc = urlparse(url).netloc.lower()
+        netloc = _split(url).netloc.lower()
         return 'linkedin.com' in netloc
     except Exception:
         return False
@@ -338,15 +450,10 @@ def is_newsroom_url(url: str) -> bool:
         True if likely newsroom, False otherwise
     """
     try:
-        path = urlparse(url).path.lower()
+        path = _split(url).path.lower()
         
         # Common newsroom indicators
-        indicators = [
-            '/news', '/newsroom', '/press', '/media',
-            '/press-release', '/presse', '/aktuelles'
-        ]
-        
-        return any(ind in path for ind in indicators)
+        return any(ind in path for ind in NEWSROOM_PATH_INDICATORS)
     except Exception:
         return False
 
@@ -363,21 +470,16 @@ def is_investor_relations_url(url: str) -> bool:
     """
     try:
         url_lower = url.lower()
-        parsed = urlparse(url_lower)
+        parsed = _split(url_lower)
         path = parsed.path
         netloc = parsed.netloc
         
         # Subdomain indicators
-        if netloc.startswith('ir.') or netloc.startswith('investors.'):
+        if netloc.startswith(('ir.', 'investors.')):
             return True
         
         # Path indicators
-        ir_indicators = [
-            '/investor', '/ir/', '/shareholder',
-            '/financial-report', '/earnings', '/quarterly'
-        ]
-        
-        return any(ind in path for ind in ir_indicators)
+        return any(ind in path for ind in IR_PATH_INDICATORS)
     except Exception:
         return False
 
@@ -396,13 +498,7 @@ def is_earnings_report_url(url: str) -> bool:
         url_lower = url.lower()
         
         # Path/query indicators
-        earnings_indicators = [
-            'earnings', 'quarterly', 'q1-', 'q2-', 'q3-', 'q4-',
-            'financial-report', 'annual-report', 'fiscal-year',
-            'results', 'fy20', 'fy21', 'fy22', 'fy23', 'fy24', 'fy25', 'fy26'
-        ]
-        
-        return any(ind in url_lower for ind in earnings_indicators)
+        return any(ind in url_lower for ind in EARNINGS_URL_INDICATORS)
     except Exception:
         return False
 
@@ -424,15 +520,10 @@ def clean_url(url: str) -> str:
         parsed = urlparse(url)
         
         # Remove tracking parameters
-        tracking_params = [
-            'utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content',
-            'fbclid', 'gclid', 'msclkid', '_ga', 'mc_cid', 'mc_eid'
-        ]
-        
         query_params = parse_qsl(parsed.query, keep_blank_values=True)
         filtered_params = [
             (k, v) for k, v in query_params
-            if k.lower() not in tracking_params
+            if k.lower() not in TRACKING_PARAMS
         ]
         
         clean_query = urlencode(filtered_params) if filtered_params else ''
@@ -466,7 +557,7 @@ def is_valid_url(url: str) -> bool:
         True if valid, False otherwise
     """
     try:
-        parsed = urlparse(url)
+        parsed = _split(url)
         return all([
             parsed.scheme in ('http', 'https'),
             parsed.netloc,
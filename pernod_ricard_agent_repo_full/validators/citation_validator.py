@@ -45,6 +45,9 @@ class CitationValidator:
             if url and text:
                 self.source_texts[url] = text
         
+        # URL -> normalized text, filled lazily (many signals share one source)
+        self._normalized_texts = {}
+        
         # Statistics
         self.stats = {
             'total_validated': 0,
@@ -90,7 +93,9 @@ class CitationValidator:
         
         # Rule 4: Quote must exist in source text (fuzzy matching)
         source_text = self.source_texts[source_url]
-        if not self._fuzzy_contains(source_text, verbatim):
+        if not self._fuzzy_contains(
+            source_text, verbatim, text_norm=self._get_normalized_text(source_url)
+        ):
             return self._reject(
                 f"Quote not found in source: '{verbatim[:50]}...'"
             )
@@ -151,17 +156,31 @@ class CitationValidator:
     # VALIDATION HELPERS
     # ==========================================================================
     
-    def _fuzzy_contains(self, text: str, quote: str) -> bool:
+    def _get_normalized_text(self, url: str) -> str:
+        """Normalized source text for url (computed once per source)."""
+        text_norm = self._normalized_texts.get(url)
+        if text_norm is None:
+            text_norm = normalize_text(self.source_texts[url])
+            self._normalized_texts[url] = text_norm
+        return text_norm
+    
+    def _fuzzy_contains(self, text: str, quote: str, text_norm: Optional[str] = None) -> bool:
         """
         Check if quote exists in text with fuzzy matching.
         
         Allows minor differences (typos, punctuation variations).
+        
+        Args:
+            text: Source text
+            quote: Quote to look for
+            text_norm: Already normalized text (skips re-normalizing text)
         """
         if not text or not quote:
             return False
         
         # Normalize both
-        text_norm = normalize_text(text)
+        if text_norm is None:
+            text_norm = normalize_text(text)
         quote_norm = normalize_text(quote)
         
         # Fast path: Direct substring match
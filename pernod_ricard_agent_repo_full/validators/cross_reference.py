@@ -36,13 +36,37 @@ class CrossReferenceValidator:
             'single_source': 0
         }
     
-    def find_corroborating_sources(self, signal: dict, all_sources: list[dict]) -> list[str]:
+    @staticmethod
+    def build_source_index(sources: list[dict]) -> list[tuple[str, str]]:
+        """
+        Normalize every source text once.
+        
+        Args:
+            sources: List of source dicts
+        
+        Returns:
+            List of (url, normalized_text) for sources that have text
+        """
+        index = []
+        for source in sources:
+            text = source.get('raw_text', '') or source.get('text', '')
+            if text:
+                index.append((source.get('url', ''), normalize_text(text)))
+        return index
+    
+    def find_corroborating_sources(
+        self,
+        signal: dict,
+        all_sources: list[dict],
+        source_index: list[tuple[str, str]] = None
+    ) -> list[str]:
         """
         Find additional sources that mention the same fact.
         
         Args:
             signal: Signal dict to validate
             all_sources: List of all source dicts
+            source_index: Optional precomputed build_source_index(all_sources)
         
         Returns:
             List of URLs of corroborating sources
@@ -77,23 +101,17 @@ class CrossReferenceValidator:
             if period_norm:
                 search_terms.append(period_norm)
         
+        if source_index is None:
+            source_index = self.build_source_index(all_sources)
+        
         # Search in all sources
         corroborating_urls = []
         
-        for source in all_sources:
-            source_url = source.get('url', '')
-            
+        for source_url, text_normalized in source_index:
             # Skip original source
             if source_url == original_url:
                 continue
             
-            # Get text
-            text = source.get('raw_text', '') or source.get('text', '')
-            if not text:
-                continue
-            
-            text_normalized = normalize_text(text)
-            
             # Count how many search terms appear
             matches = sum(
                 1 for term in search_terms
@@ -109,7 +127,8 @@ class CrossReferenceValidator:
     def validate_signals_cross_reference(
         self,
         signals: list[dict],
-        sources: list[dict]
+        sources: list[dict],
+        source_index: list[tuple[str, str]] = None
     ) -> list[dict]:
         """
         Validate signals and adjust confidence based on corroboration.
@@ -117,17 +136,23 @@ class CrossReferenceValidator:
         Args:
             signals: List of signal dicts
             sources: List of source dicts
+            source_index: Optional precomputed build_source_index(sources)
+                (lets callers validate signals in batches without re-indexing)
         
         Returns:
             List of signals with updated confidence scores
         """
         enhanced_signals = []
         
+        # Normalize source texts once, not once per signal
+        if source_index is None:
+            source_index = self.build_source_index(sources)
+        
         for signal in signals:
             self.stats['total_checked'] += 1
             
             # Find corroborating sources
-            corroborating = self.find_corroborating_sources(signal, sources)
+            corroborating = self.find_corroborating_sources(signal, sources, source_index)
             
             signal['corroborating_sources'] = corroborating
             signal['corroboration_count'] = len(corroborating)